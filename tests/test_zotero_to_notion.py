@@ -0,0 +1,498 @@
+"""
+Tests for the concurrent sync, the sync cache and the date parsing of `zotero_to_notion.py`.
+
+The Zotero and Notion APIs are replaced by `FakeApi`, an in-memory session that serves the
+few endpoints used by `ZoteroToNotion`, so no network access or credentials are needed.
+"""
+
+# pylint: disable=unused-argument; The fakes accept the keyword arguments passed to requests
+# pylint: disable=missing-function-docstring; The test names describe what each test checks
+
+import copy
+import itertools
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode
+
+from zotero_notion_sync.config import Settings
+from zotero_notion_sync.sync_cache import SyncCache
+from zotero_notion_sync.zotero_to_notion import (
+    _DATE_FORMATS,
+    _NOTION_PAGES_URL,
+    ZOTERO_MAX_WORKERS,
+    ZOTERO_PAGE_SIZE,
+    ZoteroToNotion,
+    _create_session,
+    _parse_date,
+)
+
+DATABASE_ID = "database"
+
+
+class FakeResponse:  # pylint: disable=too-few-public-methods
+    """The subset of `requests.Response` read by `ZoteroToNotion`."""
+
+    def __init__(self, status_code, data, headers=None):
+        self.status_code = status_code
+        self._data = data
+        self.headers = headers or {}
+        self.text = str(data)
+
+    def json(self):
+        """Return a copy of the body, like a freshly parsed response."""
+        return copy.deepcopy(self._data)
+
+
+def _matches(page, condition):
+    """Evaluate the Notion filters built by `ZoteroToNotion` against a fake page."""
+    if "and" in condition:
+        return all(_matches(page, part) for part in condition["and"])
+    if "or" in condition:
+        return any(_matches(page, part) for part in condition["or"])
+    if condition["property"] == "Title":
+        return page["title"] == condition["title"]["equals"]
+    return condition["multi_select"]["contains"] in page["collections"]
+
+
+class FakeApi:  # pylint: disable=too-many-instance-attributes
+    """
+    An in-memory Zotero library and Notion database behind a `requests.Session`-like interface.
+
+    Page creation sleeps for `create_delay` seconds, so concurrent workers that don't
+    coordinate would both see the title as missing and create duplicates. Setting
+    `query_status`, `prefetch_status` (for the unfiltered query prefetching the database) or
+    `update_status` to an error code makes those requests fail.
+
+    Zotero items are served `limit` at a time from the `start` offset, with a `Total-Results`
+    header or, with `link_pagination`, a `rel="next"` link instead; the page starting at
+    `failing_start` fails and the one starting at `slow_start` takes 50 ms.
+    """
+
+    def __init__(self, items, collections, create_delay=0.0):
+        self.items = items
+        self.collections = collections
+        self.create_delay = create_delay
+        self.query_status = 200
+        self.prefetch_status = 200
+        self.update_status = None
+        self.link_pagination = False
+        self.failing_start = None
+        self.slow_start = None
+        # `start` offset of every Zotero items request
+        self.item_requests = []
+        # {page_id: {"title", "collections", "edited"}}
+        self.pages = {}
+        # (method, page_id) of every page created or updated
+        self.writes = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None):
+        """Serve the Zotero collections or a page of Zotero items."""
+        if url.endswith("/collections"):
+            return FakeResponse(
+                200,
+                [
+                    {"key": key, "data": {"name": name}}
+                    for key, name in self.collections.items()
+                ],
+            )
+
+        if params is None:
+            # A "next" link carries the query parameters
+            url, _, query = url.partition("?")
+            params = dict(parse_qsl(query))
+        start = int(params.get("start", 0))
+        end = start + int(params.get("limit", len(self.items)))
+        with self._lock:
+            self.item_requests.append(start)
+        if start == self.failing_start:
+            return FakeResponse(500, {"object": "error"})
+        if start == self.slow_start:
+            time.sleep(0.05)
+
+        if not self.link_pagination:
+            headers = {"Total-Results": str(len(self.items))}
+        elif end < len(self.items):
+            next_url = f"{url}?{urlencode({**params, 'start': end})}"
+            headers = {"Link": f'<{next_url}>; rel="next"'}
+        else:
+            headers = {}
+        return FakeResponse(200, self.items[start:end], headers)
+
+    def post(self, url, params=None, json=None, timeout=None):
+        """Serve a Notion database query or create a Notion page."""
+        if url.endswith("/query"):
+            return self._query(json)
+
+        time.sleep(self.create_delay)
+        properties = json["properties"]
+        with self._lock:
+            page_id = f"page-{next(self._ids)}"
+            self._save(
+                page_id,
+                properties["Title"]["title"][0]["text"]["content"],
+                properties,
+            )
+            self.writes.append(("create", page_id))
+        return FakeResponse(200, {"id": page_id})
+
+    def patch(self, url, json=None, timeout=None):
+        """Update a Notion page (404 if it does not exist)."""
+        page_id = url.rsplit("/", 1)[1]
+        if self.update_status is not None:
+            return FakeResponse(self.update_status, {"object": "error"})
+        with self._lock:
+            if page_id not in self.pages:
+                return FakeResponse(404, {"object": "error"})
+            title = json["properties"].get("Title")
+            self._save(
+                page_id,
+                (
+                    title["title"][0]["text"]["content"]
+                    if title
+                    else self.pages[page_id]["title"]
+                ),
+                json["properties"],
+            )
+            self.writes.append(("update", page_id))
+        return FakeResponse(200, {"id": page_id})
+
+    def close(self):
+        """Do nothing; there are no connections to release."""
+
+    def _save(self, page_id, title, properties):
+        """Store a page with the collections of `properties`, as the most recently edited."""
+        self.pages[page_id] = {
+            "title": title,
+            "collections": [
+                option["name"] for option in properties["Collections"]["multi_select"]
+            ],
+            "edited": next(self._ids),
+        }
+
+    def _query(self, payload):
+        """Return the pages matching the query's filter, most recently edited first."""
+        status = self.query_status if "filter" in payload else self.prefetch_status
+        if status != 200:
+            return FakeResponse(status, {"object": "error"})
+        with self._lock:
+            pages = sorted(
+                (
+                    (page_id, page)
+                    for page_id, page in self.pages.items()
+                    if "filter" not in payload or _matches(page, payload["filter"])
+                ),
+                key=lambda entry: entry[1]["edited"],
+                reverse=True,
+            )
+        return FakeResponse(
+            200,
+            {
+                "results": [
+                    {
+                        "id": page_id,
+                        "properties": {
+                            "Title": {"title": [{"plain_text": page["title"]}]},
+                            "Collections": {
+                                "multi_select": [
+                                    {"name": name} for name in page["collections"]
+                                ]
+                            },
+                        },
+                    }
+                    for page_id, page in pages
+                ],
+                "has_more": False,
+            },
+        )
+
+
+def _item(key, title, collections, version=1):
+    """Build a Zotero item as returned by the items endpoint."""
+    return {
+        "key": key,
+        "version": version,
+        "data": {"title": title, "collections": collections, "itemType": "book"},
+    }
+
+
+class FakeApiTestCase(unittest.TestCase):
+    """Runs `sync_all_references_to_notion` against a `FakeApi`."""
+
+    def setUp(self):
+        self.settings = Settings(
+            ZOTERO_API_KEY="zotero-key",
+            ZOTERO_USER_ID="user",
+            NOTION_API_KEY="notion-key",
+            NOTION_DATABASE_ID=DATABASE_ID,
+        )
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.cache_path = os.path.join(directory.name, "cache.db")
+
+    def sync(self, api, cache=None):
+        """Sync the fake Zotero library to the fake Notion database."""
+        with ZoteroToNotion(self.settings, cache=cache) as zotero_to_notion:
+            zotero_to_notion.zotero_session = api
+            zotero_to_notion.notion_session = api
+            zotero_to_notion.sync_all_references_to_notion()
+
+    def sync_with_cache(self, api):
+        """Sync like `sync`, through a `SyncCache` kept at `cache_path` across calls."""
+        with SyncCache(self.cache_path, DATABASE_ID) as cache:
+            self.sync(api, cache)
+
+
+class SyncTestCase(FakeApiTestCase):
+    """Concurrent upserts and the sync cache."""
+
+    def test_concurrent_upserts_of_a_shared_title_create_one_page(self):
+        # Not exact duplicates, but the second reference matches the first one's page
+        api = FakeApi(
+            [
+                _item("A", "Shared title", ["c1"]),
+                _item("B", "Shared title", ["c1", "c2"]),
+            ],
+            {"c1": "One", "c2": "Two"},
+            create_delay=0.05,
+        )
+
+        self.sync(api)
+
+        self.assertEqual(len(api.pages), 1)
+        self.assertEqual([method for method, _ in api.writes], ["create", "update"])
+
+    def test_cache_skips_unchanged_items(self):
+        api = FakeApi([_item("A", "Title", ["c1"])], {"c1": "One"})
+        self.sync_with_cache(api)
+        api.writes.clear()
+
+        self.sync_with_cache(api)
+
+        self.assertEqual(api.writes, [])
+
+    def test_cache_resyncs_items_whose_collection_names_changed(self):
+        api = FakeApi([_item("A", "Title", ["c1"])], {"c1": "One"})
+        self.sync_with_cache(api)
+        page_id = next(iter(api.pages))
+        api.writes.clear()
+
+        # Renaming a collection does not bump the version of its items
+        api.collections["c1"] = "Renamed"
+        self.sync_with_cache(api)
+
+        self.assertEqual(api.writes, [("update", page_id)])
+        self.assertEqual(api.pages[page_id]["collections"], ["Renamed"])
+
+    def test_cache_recreates_pages_deleted_in_notion(self):
+        api = FakeApi([_item("A", "Title", ["c1"])], {"c1": "One"})
+        self.sync_with_cache(api)
+        api.pages.clear()
+        api.writes.clear()
+
+        self.sync_with_cache(api)
+
+        self.assertEqual([method for method, _ in api.writes], ["create"])
+        self.assertEqual(len(api.pages), 1)
+
+    def test_cache_renames_the_page_of_a_renamed_item(self):
+        api = FakeApi([_item("A", "Old title", ["c1"])], {"c1": "One"})
+        self.sync_with_cache(api)
+        page_id = next(iter(api.pages))
+
+        api.items = [_item("A", "New title", ["c1"], version=2)]
+        self.sync_with_cache(api)
+
+        self.assertEqual(api.pages[page_id]["title"], "New title")
+
+        # A run without the cache finds the renamed page instead of adding a second one
+        self.sync(api)
+
+        self.assertEqual(list(api.pages), [page_id])
+
+
+class NotionFailureTestCase(FakeApiTestCase):
+    """Failed Notion requests must not be mistaken for missing pages."""
+
+    def test_failed_queries_write_nothing(self):
+        api = FakeApi([_item("A", "Title", ["c1"])], {"c1": "One"})
+        self.sync(api)
+        api.writes.clear()
+
+        api.query_status = api.prefetch_status = 500
+        api.items = [_item("A", "Title", ["c1"], version=2)]
+        self.sync(api)
+
+        self.assertEqual(api.writes, [])
+        self.assertEqual(len(api.pages), 1)
+
+    def test_unavailable_cached_page_is_kept(self):
+        api = FakeApi([_item("A", "Title", ["c1"])], {"c1": "One"})
+        self.sync_with_cache(api)
+        page_id = next(iter(api.pages))
+
+        # Re-looking the renamed item up by title would miss its page and add a duplicate
+        api.update_status = 503
+        api.items = [_item("A", "New title", ["c1"], version=2)]
+        self.sync_with_cache(api)
+
+        self.assertEqual(list(api.pages), [page_id])
+        with SyncCache(self.cache_path, DATABASE_ID) as cache:
+            self.assertEqual(cache.get("A")[::2], (1, page_id))
+
+    def test_missing_cached_page_is_recreated(self):
+        api = FakeApi([_item("A", "Title", ["c1"])], {"c1": "One"})
+        self.sync_with_cache(api)
+        old_page_id = next(iter(api.pages))
+
+        # Without the prefetched database, the deletion is only noticed from the 404
+        api.pages.clear()
+        api.prefetch_status = 500
+        api.items = [_item("A", "Title", ["c1"], version=2)]
+        self.sync_with_cache(api)
+
+        self.assertEqual(len(api.pages), 1)
+        new_page_id = next(iter(api.pages))
+        self.assertNotEqual(new_page_id, old_page_id)
+        with SyncCache(self.cache_path, DATABASE_ID) as cache:
+            self.assertEqual(cache.get("A")[::2], (2, new_page_id))
+
+
+class ZoteroPaginationTestCase(FakeApiTestCase):
+    """`iter_zotero_references` fetches pages concurrently but yields them in order."""
+
+    def setUp(self):
+        super().setUp()
+        self.api = FakeApi(
+            [_item(f"K{number:03}", f"Title {number}", []) for number in range(250)],
+            {},
+        )
+
+    def references(self, count=None):
+        """Return the keys of the first `count` references (or all) and close the iterator."""
+        with ZoteroToNotion(self.settings) as zotero_to_notion:
+            zotero_to_notion.zotero_session = self.api
+            references = zotero_to_notion.iter_zotero_references()
+            keys = [
+                reference["key"] for reference in itertools.islice(references, count)
+            ]
+            references.close()
+        return keys
+
+    def test_total_results_pages_are_yielded_in_order(self):
+        # The later pages arrive first
+        self.api.slow_start = 100
+
+        self.assertEqual(self.references(), [item["key"] for item in self.api.items])
+        self.assertEqual(sorted(self.api.item_requests), [0, 100, 200])
+
+    def test_next_links_are_followed(self):
+        self.api.link_pagination = True
+
+        self.assertEqual(self.references(), [item["key"] for item in self.api.items])
+        self.assertEqual(self.api.item_requests, [0, 100, 200])
+
+    def test_failed_page_stops_the_iteration(self):
+        self.api.failing_start = 100
+
+        self.assertEqual(
+            self.references(), [item["key"] for item in self.api.items[:100]]
+        )
+
+    def test_closing_stops_fetching_pages(self):
+        self.api.items = [
+            _item(f"K{number:04}", f"Title {number}", []) for number in range(2000)
+        ]
+
+        self.references(ZOTERO_PAGE_SIZE + 1)
+
+        # The first page, the pages fetched ahead and the one requested when a page was consumed
+        self.assertLessEqual(len(self.api.item_requests), ZOTERO_MAX_WORKERS + 2)
+
+
+class SessionRetryTestCase(unittest.TestCase):
+    """Page creation is not idempotent, so only its rate limits are retried."""
+
+    def setUp(self):
+        self.session = _create_session({}, create_url=_NOTION_PAGES_URL)
+        self.addCleanup(self.session.close)
+
+    def retry(self, url):
+        """Return the `Retry` used for requests to `url`."""
+        return self.session.get_adapter(url).max_retries
+
+    def test_page_creation_only_retries_rate_limits(self):
+        retry = self.retry(_NOTION_PAGES_URL)
+
+        self.assertTrue(retry.is_retry("POST", 429, has_retry_after=True))
+        for status in (500, 502, 503, 504):
+            with self.subTest(status=status):
+                self.assertFalse(retry.is_retry("POST", status, has_retry_after=True))
+        self.assertEqual(retry.read, 0)
+
+    def test_updates_and_queries_keep_the_full_retries(self):
+        for url in (
+            f"{_NOTION_PAGES_URL}/page-1",
+            f"https://api.notion.com/v1/databases/{DATABASE_ID}/query",
+        ):
+            with self.subTest(url=url):
+                retry = self.retry(url)
+                self.assertTrue(retry.is_retry("POST", 503))
+                self.assertIsNone(retry.read)
+
+
+def _strptime_date(date_str):
+    """Parse `date_str` with the strptime formats alone (the behaviour before the fast paths)."""
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, date_format).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+
+class ParseDateTestCase(unittest.TestCase):
+    """The fast paths of `_parse_date` must agree with the strptime fallback."""
+
+    DATES = (
+        "2023-05-15T13:34:41+00:00",
+        "2023-05-15T13:34:41-0530",
+        "2023-05-15T13:34:41Z",
+        "2023-05-15T23:59:59Z",
+        "2023-05-15T24:00:00Z",
+        "2023-05-15T13:60:00Z",
+        "2023-05-15T25:00:00+00:00",
+        "2023-05-15",
+        "2023-5-15",
+        "2023-02-29",
+        "2024-02-29",
+        "2023-13-01",
+        "2023-00-10",
+        "2023-05-15\n",
+        "2023/5",
+        "2023/05",
+        "2023/13",
+        "2023",
+        "0000",
+        "May 2023",
+        "15/05/2023",
+        # Non-ASCII digits (Arabic-Indic two, fullwidth digits)
+        "2023-0\u0662-15",
+        "2023-05-15T13:34:4\u0662Z",
+        "\uff12\uff10\uff12\uff13",
+        "2023/\u0665",
+    )
+
+    def test_fast_paths_match_strptime(self):
+        for date_str in self.DATES:
+            with self.subTest(date_str=date_str):
+                self.assertEqual(_parse_date(date_str), _strptime_date(date_str))
+
+
+if __name__ == "__main__":
+    unittest.main()
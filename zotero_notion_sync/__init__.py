@@ -3,3 +3,8 @@ This file is created for two reasons:
 - To enable relative imports (e.g., from .config import config)
 - To enable the module to be imported as a package if needed
 """
+
+import logging
+
+# Stay silent unless the application configures logging (see logging_config.configure_logging)
+logging.getLogger(__name__).addHandler(logging.NullHandler())
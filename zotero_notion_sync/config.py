@@ -1,14 +1,94 @@
 """
 Module Name: config.py
-Description: This module handles the configuration settings for the Zotero to Notion 
-synchronization project. It loads environment variables and sets the required 
+Description: This module handles the configuration settings for the Zotero to Notion
+synchronization project. It loads environment variables and sets the required
 credentials for accessing the Zotero and Notion APIs.
+
+The `.env` file is parsed at most once per process, and `get_settings()` returns a
+cached, immutable `Settings` instance that can be injected into `ZoteroToNotion`.
 """
 
 import os
-from dotenv import load_dotenv
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Default location of the sync cache (overridden by the `ZNS_CACHE_PATH` environment variable)
+DEFAULT_CACHE_PATH = os.path.join("~", ".cache", "zotero_notion_sync.db")
+
+
+def _find_dotenv():
+    """
+    Locate the `.env` file without importing `dotenv`.
+
+    Like `dotenv.find_dotenv()`, the directories from this package up to the filesystem root
+    are searched first, so runs from another working directory (e.g., cron jobs) still find the
+    project's `.env`; the current working directory is checked last.
+
+    Returns:
+        str or None: The path of the first `.env` file found, or None.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        candidate = os.path.join(directory, ".env")
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+
+    return ".env" if os.path.isfile(".env") else None
+
+
+@lru_cache(maxsize=1)
+def _load():
+    """
+    Load the `.env` file into the environment once per process.
+
+    The file path can be overridden with `ZNS_DOTENV`; otherwise it is searched for with
+    `_find_dotenv`. When no such file exists (e.g., in containers where the variables are
+    injected directly), `dotenv` is never imported.
+    """
+    dotenv_path = os.environ.get("ZNS_DOTENV") or _find_dotenv()
+    if dotenv_path and os.path.exists(dotenv_path):
+        from dotenv import load_dotenv  # pylint: disable=import-outside-toplevel
+
+        load_dotenv(dotenv_path)
+    return True
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Immutable container for the Zotero and Notion credentials and the sync options."""
+
+    # pylint: disable=invalid-name; Field names mirror the environment variables
+    ZOTERO_API_KEY: str | None
+    ZOTERO_USER_ID: str | None
+    NOTION_API_KEY: str | None
+    NOTION_DATABASE_ID: str | None
+    # Path of the SyncCache database; an empty value disables the cache
+    ZNS_CACHE_PATH: str = ""
+
+
+@lru_cache(maxsize=1)
+def get_settings():
+    """
+    Build the settings from the environment.
+
+    Returns:
+        Settings: The cached settings instance shared by all callers.
+    """
+    _load()
+    return Settings(
+        ZOTERO_API_KEY=os.getenv("ZOTERO_API_KEY"),
+        ZOTERO_USER_ID=os.getenv("ZOTERO_USER_ID"),
+        NOTION_API_KEY=os.getenv("NOTION_API_KEY"),
+        NOTION_DATABASE_ID=os.getenv("NOTION_DATABASE_ID"),
+        ZNS_CACHE_PATH=os.getenv("ZNS_CACHE_PATH", DEFAULT_CACHE_PATH),
+    )
+
 
-load_dotenv()
+_load()
 
 # Zotero Credentials
 ZOTERO_API_KEY = os.getenv("ZOTERO_API_KEY")
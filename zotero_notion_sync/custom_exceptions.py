@@ -12,3 +12,10 @@ class InvalidReferenceError(Exception):
 
     def __init__(self, message="Invalid reference provided"):
         super().__init__(message)
+
+
+class NotionQueryError(Exception):
+    """Exception raised when a Notion database query fails (as opposed to finding no match)."""
+
+    def __init__(self, message="Notion database query failed"):
+        super().__init__(message)
@@ -6,11 +6,28 @@ executing the wrapped function, raising custom exceptions or logging errors when
 """
 
 import logging
-from functools import wraps
+import sys
+from functools import lru_cache, partial, update_wrapper
 from zotero_notion_sync.custom_exceptions import InvalidReferenceError
 
+# Module logger (the root `logging.error` shortcut re-checks basicConfig on every call)
+logger = logging.getLogger(__name__)
+_ERR_ENABLED = logger.isEnabledFor
+_log = logger.log
+_ERROR = logging.ERROR
 
-def validate_key(reference, required_key):
+# Lighter than functools.wraps: skip __annotations__ and the __dict__ update (still sets __wrapped__)
+_light_wraps = partial(
+    update_wrapper,
+    assigned=("__module__", "__name__", "__qualname__", "__doc__"),
+    updated=(),
+)
+
+# A creator needs at least one of these keys
+_CREATOR_KEYS = frozenset(("name", "lastName", "firstName"))
+
+
+def validate_key(reference, required_key, _dict=dict):
     """
     Validate that the reference is a dictionary and contains the required key.
 
@@ -21,7 +38,11 @@ def validate_key(reference, required_key):
     Returns:
         bool: True if valid, False otherwise.
     """
-    return isinstance(reference, dict) and required_key in reference
+    # Exact-type check first; isinstance is only needed for dict subclasses
+    return (
+        type(reference) is _dict  # pylint: disable=unidiomatic-typecheck
+        or isinstance(reference, _dict)
+    ) and required_key in reference
 
 
 def validate_creators_list(creators):
@@ -36,14 +57,82 @@ def validate_creators_list(creators):
     """
     if not isinstance(creators, list):
         return False
-    for creator in creators:
-        if not isinstance(creator, dict) or (
-            "name" not in creator
-            and "lastName" not in creator
-            and "firstName" not in creator
-        ):
-            return False
-    return True
+    # isdisjoint runs in C and stops at the first matching key
+    return all(
+        type(creator) is dict  # pylint: disable=unidiomatic-typecheck
+        and not _CREATOR_KEYS.isdisjoint(creator)
+        for creator in creators
+    )
+
+
+def validate_references_bulk(references, required_key="data"):
+    """
+    Validate a batch of references in a single pass.
+
+    Args:
+        references (list): The reference data to validate.
+        required_key (str): The key that must be present in each reference. Defaults to "data".
+
+    Returns:
+        list: A boolean mask with one entry per reference (True if valid, False otherwise).
+    """
+    required_key = sys.intern(required_key)
+    _dict = dict
+    return [
+        type(reference) is _dict  # pylint: disable=unidiomatic-typecheck
+        and required_key in reference
+        for reference in references
+    ]
+
+
+def filter_valid(references, required_key="data"):
+    """
+    Keep only the references that are dictionaries containing the required key.
+
+    Args:
+        references (list): The reference data to filter.
+        required_key (str): The key that must be present in each reference. Defaults to "data".
+
+    Returns:
+        list: The valid references, in their original order.
+    """
+    required_key = sys.intern(required_key)
+    _dict = dict
+    return [
+        reference
+        for reference in references
+        if type(reference) is _dict  # pylint: disable=unidiomatic-typecheck
+        and required_key in reference
+    ]
+
+
+@lru_cache(maxsize=None)
+def _make_reference_wrapper(func, required_key):
+    """Build (once per `func`/`required_key` pair) the wrapper used by `validate_reference_with_key`."""
+
+    def wrapper(self, reference, *args, **kwargs):
+        # Check the predicate directly instead of raising and catching our own error
+        if not validate_key(reference, required_key):
+            if _ERR_ENABLED(_ERROR):
+                _log(
+                    _ERROR,
+                    "Validation error: Missing key '%s' in reference.",
+                    required_key,
+                )
+            return None
+
+        try:
+            return func(self, reference, *args, **kwargs)
+        except InvalidReferenceError as e:
+            if _ERR_ENABLED(_ERROR):
+                _log(_ERROR, "Validation error: %s", e)
+            return None
+        except Exception as e:
+            if _ERR_ENABLED(_ERROR):
+                _log(_ERROR, "An error occurred: %s", e)
+            raise
+
+    return _light_wraps(wrapper, func)
 
 
 def validate_reference_with_key(required_key="data"):
@@ -51,9 +140,9 @@ def validate_reference_with_key(required_key="data"):
     Decorator to validate the `reference` argument of a method for the presence of a specified key.
 
     This decorator ensures that the `reference` argument passed to the decorated method is a dictionary
-    containing the required key. If the `reference` is not a dictionary or the key is missing, an
-    `InvalidReferenceError` is raised and the method execution is halted. Any exceptions during the
-    validation or method execution are logged as errors.
+    containing the required key. If the `reference` is not a dictionary or the key is missing, a
+    validation error is logged and the method execution is halted (returning None). Any exceptions
+    during the method execution are logged as errors.
 
     Args:
         required_key (str): The key that must be present in the `reference` dictionary. Defaults to "data".
@@ -61,51 +150,76 @@ def validate_reference_with_key(required_key="data"):
     Returns:
         function: The wrapped function with the added validation.
 
-    Raises:
-        InvalidReferenceError: If `reference` is not a dictionary or the `required_key` is not found in it.
+    Note:
+        Validation failures are not raised; the check is a plain predicate so the happy path does
+        not pay for an exception handler frame on every call.
 
     Example:
         @validate_reference_with_key("data")
         def process_reference(self, reference):
             ...
     """
+    # The default key is by far the most common, so reuse its prebuilt decorator
+    if required_key == "data":
+        return _DATA_DECORATOR
+    return _build_reference_decorator(required_key)
+
+
+def _build_reference_decorator(required_key):
+    """Build the decorator returned by `validate_reference_with_key` for `required_key`."""
+    # Intern the key once so dictionary probes can match on identity
+    required_key = sys.intern(required_key)
 
     def decorator(func):
-        @wraps(func)
-        def wrapper(self, reference, *args, **kwargs):
-            try:
-                if not validate_key(reference, required_key):
-                    raise InvalidReferenceError(
-                        f"Missing key '{required_key}' in reference."
-                    )
-                return func(self, reference, *args, **kwargs)
-            except InvalidReferenceError as e:
-                logging.error("Validation error: %s", e)
-                return None
-            except Exception as e:
-                logging.error("An error occurred: %s", e)
-                raise
-
-        return wrapper
+        return _make_reference_wrapper(func, required_key)
 
     return decorator
 
 
+@lru_cache(maxsize=None)
+def _make_creators_wrapper(func):
+    """Build (once per `func`) the wrapper used by `validate_creators`."""
+
+    def wrapper(self, creators, *args, **kwargs):
+        # Check the predicate directly instead of raising and catching our own error
+        if not validate_creators_list(creators):
+            if _ERR_ENABLED(_ERROR):
+                _log(
+                    _ERROR,
+                    "Validation error: Creators should be a list of dictionaries with "
+                    "'name', 'lastName', or 'firstName' keys.",
+                )
+            return None  # Ensure a safe return after the error
+
+        try:
+            return func(self, creators, *args, **kwargs)
+        except InvalidReferenceError as e:
+            if _ERR_ENABLED(_ERROR):
+                _log(_ERROR, "Validation error: %s", e)
+            return None
+        except Exception as e:
+            if _ERR_ENABLED(_ERROR):
+                _log(_ERROR, "An unexpected error occurred: %s", e)
+            raise
+
+    return _light_wraps(wrapper, func)
+
+
 def validate_creators():
     """
     Decorator to validate the `creators` argument of a method.
 
     This decorator ensures that the `creators` argument passed to the decorated method
     is a list of dictionaries, each containing at least one of the required keys: 'name',
-    'lastName', or 'firstName'. If the validation fails, an `InvalidReferenceError` is raised,
-    logged, and the decorated method is not executed.
+    'lastName', or 'firstName'. If the validation fails, a validation error is logged, None is
+    returned, and the decorated method is not executed.
 
     Returns:
         function: The wrapped function with the added validation.
 
-    Raises:
-        InvalidReferenceError: If the `creators` argument is not a list or if any item in the list
-        is not a dictionary containing the required keys.
+    Note:
+        Validation failures are logged rather than raised, so no exception is constructed when the
+        `creators` argument is not a list or contains items without the required keys.
 
     Example:
         @validate_creators()
@@ -114,22 +228,21 @@ def validate_creators():
     """
 
     def decorator(func):
-        @wraps(func)
-        def wrapper(self, creators, *args, **kwargs):
-            try:
-                if not validate_creators_list(creators):
-                    raise InvalidReferenceError(
-                        "Creators should be a list of dictionaries with 'name', 'lastName', or 'firstName' keys."
-                    )
-
-                return func(self, creators, *args, **kwargs)
-            except InvalidReferenceError as e:
-                logging.error("Validation error: %s", e)
-                return None  # Ensure a safe return after the error
-            except Exception as e:
-                logging.error("An unexpected error occurred: %s", e)
-                raise
-
-        return wrapper
+        return _make_creators_wrapper(func)
 
     return decorator
+
+
+_DATA_DECORATOR = _build_reference_decorator("data")
+
+
+def validate_reference_with_data(func):
+    """
+    Prebuilt equivalent of `@validate_reference_with_key("data")`.
+
+    Example:
+        @validate_reference_with_data
+        def process_reference(self, reference):
+            ...
+    """
+    return _DATA_DECORATOR(func)
@@ -4,21 +4,25 @@ Description:
     This module sets up a custom logging configuration that uses colored formatting for log messages. 
     It defines a `ColorFormatter` class that formats log messages using ANSI color codes to make log levels 
     more visually distinguishable. The module also configures the root logger to use the custom formatter 
-    with a stream handler.
+    with a stream handler when `configure_logging()` is called explicitly (e.g., from `main.py`).
 
 Classes:
     ColorFormatter(logging.Formatter):
         A custom logging formatter that adds ANSI color codes to log levels based on the log severity.
+        The colored level name is available to format strings as `%(clevelname)s`.
 
 Usage:
-    Import this module to enable colored logging for DEBUG, INFO, WARNING, ERROR, and CRITICAL levels.
+    Call `configure_logging()` to enable colored logging for DEBUG, INFO, WARNING, ERROR, and CRITICAL levels.
+    The root level defaults to WARNING and can be overridden with the `ZNS_LOG_LEVEL` environment variable.
     The color-coded logs help easily distinguish between different severity levels during debugging 
     and monitoring.
 
 Example:
     ```python
     import logging
-    import logging_config  # Import to configure logging with colors
+    from zotero_notion_sync.logging_config import configure_logging
+
+    configure_logging()  # Configure logging with colors
 
     logger = logging.getLogger(__name__)
     logger.info("This is an info message.")
@@ -26,46 +30,69 @@ Example:
     ```
 
 Attributes:
-    COLORS (dict): A dictionary that maps logging levels to ANSI color codes.
+    COLORS (dict): A dictionary that maps logging level numbers to ANSI color codes.
     RESET (str): ANSI escape code to reset colors to default after each log message.
 
 Notes:
     - This logging configuration is suitable for console output where colored log messages improve readability.
     - ANSI color codes may not render properly in non-ANSI compatible terminals.
+    - When the stream is not a TTY (e.g., redirected to a file or CI log), a plain formatter is used.
 """
 
 import logging
+import os
 
 
 # pylint: disable=missing-class-docstring
 class ColorFormatter(logging.Formatter):
-    # ANSI escape sequences for colors
+    # ANSI escape sequences for colors, keyed by the integer level (record.levelno)
     COLORS = {
-        "DEBUG": "\033[94m",  # Blue
-        "INFO": "\033[92m",  # Green
-        "WARNING": "\033[93m",  # Yellow
-        "ERROR": "\033[91m",  # Red
-        "CRITICAL": "\033[1;91m",  # Bright Red
+        logging.DEBUG: "\033[94m",  # Blue
+        logging.INFO: "\033[92m",  # Green
+        logging.WARNING: "\033[93m",  # Yellow
+        logging.ERROR: "\033[91m",  # Red
+        logging.CRITICAL: "\033[1;91m",  # Bright Red
     }
     RESET = "\033[0m"  # Reset to Default Color
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Precompute the colored level names once instead of per record
+        self._colored = {
+            levelno: f"{color}{logging.getLevelName(levelno)}{self.RESET}"
+            for levelno, color in self.COLORS.items()
+        }
+
     def format(self, record):
-        color = self.COLORS.get(record.levelname, self.RESET)
-        record.levelname = f"{color}{record.levelname}{self.RESET}"
+        # Expose the colored name as `%(clevelname)s`; `levelname` is left untouched for other handlers
+        record.clevelname = self._colored.get(record.levelno, record.levelname)
 
         return super().format(record)
 
 
+def _resolve_level():
+    """Return the log level named by `ZNS_LOG_LEVEL`, defaulting to WARNING."""
+    level_name = os.environ.get("ZNS_LOG_LEVEL", "WARNING").upper()
+    # `getLevelName` maps a known name to its number (and works before Python 3.11's
+    # `getLevelNamesMapping`); unknown names come back as a "Level ..." string
+    level = logging.getLevelName(level_name)
+    return level if isinstance(level, int) else logging.WARNING
+
+
 # pylint: disable=missing-function-docstring
 def configure_logging():
-    # Create a custom formatter instance
-    formatter = ColorFormatter("%(levelname)s - %(message)s\n")
+    level = _resolve_level()
 
     # Configure the root logger with a stream handler
     handler = logging.StreamHandler()
-    handler.setFormatter(formatter)
-    logging.basicConfig(level=logging.DEBUG, handlers=[handler])
-
 
-# Configure logging when the module is imported
-configure_logging()
+    # Only colorize when writing to a terminal; files and pipes get plain level names
+    stream = handler.stream
+    is_tty = hasattr(stream, "isatty") and stream.isatty()
+    if is_tty:
+        formatter = ColorFormatter("%(clevelname)s - %(message)s\n")
+    else:
+        formatter = logging.Formatter("%(levelname)s - %(message)s\n")
+    handler.setFormatter(formatter)
+    handler.setLevel(level)
+    logging.basicConfig(level=level, handlers=[handler])
@@ -9,12 +9,27 @@ Usage:
 Run this module directly to initiate the synchronization process.
 """
 
-from zotero_notion_sync import config
+from contextlib import nullcontext
+from zotero_notion_sync.config import get_settings
+from zotero_notion_sync.logging_config import configure_logging
+from zotero_notion_sync.sync_cache import SyncCache
 from zotero_notion_sync.zotero_to_notion import ZoteroToNotion
 
 if __name__ == "__main__":
-    # Create an instance of the ZoteroToNotion class with dependency injection
-    zotero_to_notion = ZoteroToNotion(config)
+    # Configure colored logging for the command-line run
+    configure_logging()
 
-    # Call the sync_zotero_to_notion method
-    zotero_to_notion.sync_all_references_to_notion()
+    settings = get_settings()
+
+    # The cache lets unchanged Zotero items be skipped (disabled when ZNS_CACHE_PATH is empty)
+    cache_context = (
+        SyncCache(settings.ZNS_CACHE_PATH, settings.NOTION_DATABASE_ID)
+        if settings.ZNS_CACHE_PATH
+        else nullcontext()
+    )
+
+    with cache_context as cache:
+        # Create an instance of the ZoteroToNotion class with dependency injection
+        with ZoteroToNotion(settings, cache=cache) as zotero_to_notion:
+            # Sync every Zotero reference to Notion
+            zotero_to_notion.sync_all_references_to_notion()
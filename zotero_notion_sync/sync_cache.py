@@ -0,0 +1,122 @@
+"""
+Module Name: sync_cache.py
+Description: This module provides a small on-disk cache of the Zotero items already synced to Notion.
+Each row maps a Notion database ID and a Zotero item key to the item `version` that was last written
+to that database, a digest of the collection names written with it and the ID of the Notion page it
+was written to, so unchanged items can be skipped without any Notion request. The digest is needed
+because renaming a Zotero collection does not bump the version of its items. Syncing to another
+database never reuses the rows of the first one.
+
+The cache is an SQLite database (stdlib `sqlite3`) shared by the sync worker threads.
+
+Example:
+    ```python
+    with SyncCache("~/.cache/zotero_notion_sync.db", database_id) as cache:
+        cached = cache.get(item_key)
+        if cached is None or cached[:2] != (version, collections_digest(collection_names)):
+            ...
+            cache.record(item_key, version, page_id, collection_names)
+    ```
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+
+def collections_digest(collection_names):
+    """Return a short digest of the collection names written to a Notion page."""
+    return hashlib.sha1("\n".join(collection_names).encode("utf-8")).hexdigest()
+
+
+class SyncCache:
+    """
+    A thread-safe `item_key -> (zotero_version, collections_digest, notion_page_id)` store backed by SQLite.
+
+    Each instance only reads and writes the rows of `database_id`, so the same file can be
+    shared by syncs to different Notion databases. Writes are committed immediately, so the
+    state of a partial run survives an interruption.
+    """
+
+    def __init__(self, path, database_id):
+        path = os.path.expanduser(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.database_id = database_id
+
+        # The connection is shared by the sync threads and serialized with a lock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS synced_items (
+                    database_id TEXT NOT NULL,
+                    item_key TEXT NOT NULL,
+                    zotero_version INTEGER NOT NULL,
+                    notion_page_id TEXT,
+                    last_synced TEXT NOT NULL,
+                    collections_digest TEXT,
+                    PRIMARY KEY (database_id, item_key)
+                )
+                """
+            )
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get(self, item_key):
+        """
+        Look up an item synced to this cache's database.
+
+        Args:
+            item_key (str): The Zotero item key.
+
+        Returns:
+            tuple or None: The `(zotero_version, collections_digest, notion_page_id)` last synced,
+                or None if the item is unknown.
+        """
+        with self._lock:
+            return self._connection.execute(
+                "SELECT zotero_version, collections_digest, notion_page_id FROM synced_items "
+                "WHERE database_id = ? AND item_key = ?",
+                (self.database_id, item_key),
+            ).fetchone()
+
+    def record(self, item_key, version, page_id, collection_names):
+        """
+        Remember that `version` of the item was written to the Notion page `page_id`.
+
+        Args:
+            item_key (str): The Zotero item key.
+            version (int): The item version returned by Zotero.
+            page_id (str): The ID of the Notion page the item was written to.
+            collection_names (list): The collection names written to the page.
+        """
+        synced_at = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO synced_items "
+                "(database_id, item_key, zotero_version, notion_page_id, last_synced, collections_digest) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    self.database_id,
+                    item_key,
+                    version,
+                    page_id,
+                    synced_at,
+                    collections_digest(collection_names),
+                ),
+            )
@@ -10,18 +10,290 @@ It contains the `ZoteroToNotion` class and associated methods for:
 The module supports seamless data integration, allowing for enhanced workflow management and research tracking between Zotero and Notion.
 """
 
-import json
 import logging
-from datetime import datetime
+import re
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, datetime
+from functools import lru_cache, partial
+from itertools import chain, islice
 import requests
-from zotero_notion_sync.decorators import validate_reference_with_key, validate_creators
-import zotero_notion_sync.logging_config  # pylint: disable=unused-import; Though unused, this is important to make the custom logging format work
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from zotero_notion_sync.custom_exceptions import NotionQueryError
+from zotero_notion_sync.decorators import (
+    filter_valid,
+    validate_creators,
+    validate_creators_list,
+)
+from zotero_notion_sync.sync_cache import collections_digest
+
+# Logging is configured by the entry point (see logging_config.configure_logging) rather than at import time
+
+# Create a custom logger specifically for the current module (zotero_to_notion);
+# it has no level of its own, so it follows the ZNS_LOG_LEVEL set on the root logger
+ztn_logger = logging.getLogger(__name__)
 
-# logging.basicConfig(level=logging.DEBUG) # We no longer use the default logging configuration but the upgraded one (upgraded on top of the logging module)
+# Number of references synced concurrently (Notion allows an average of ~3 requests per second)
+NOTION_MAX_WORKERS = 3
+
+# Maximum page size of the Zotero API (the default is 25)
+ZOTERO_PAGE_SIZE = 100
+
+# Number of Zotero pages fetched concurrently by `iter_zotero_references`
+ZOTERO_MAX_WORKERS = 4
+
+# Number of titles combined into one `or` query by `find_references_bulk`
+NOTION_TITLES_PER_QUERY = 20
+
+# Sort order of every Notion query, so all lookups prefer the most recently edited duplicate
+_MOST_RECENT_FIRST = [{"timestamp": "last_edited_time", "direction": "descending"}]
+
+# Endpoint creating Notion pages (a page is updated at "<_NOTION_PAGES_URL>/<page_id>")
+_NOTION_PAGES_URL = "https://api.notion.com/v1/pages"
+
+# Properties set only when a page is created (shared, never mutated)
+_NEW_PAGE_DEFAULTS = {
+    "Status": {"status": {"name": "Not started"}},
+    "Category": {"select": {"name": "Academic"}},
+}
+
+# Precompiled patterns for the date formats handled by `parse_date`, from most to least specific.
+# Each captures (year, month, day) with month and day optional, and is applied with `fullmatch`
+# (unlike `$`, it does not accept a trailing newline, which strptime rejects). `re.ASCII` keeps
+# `\d` to the ASCII digits strptime accepts.
+_DATE_PATTERNS = (
+    # Full ISO format with timezone (e.g., "2023-05-15T13:34:41+00:00"); the time and offset are
+    # range-checked here since only the date is captured, so "T25:00:00Z" is rejected like strptime does
+    re.compile(
+        r"(\d{4})-(\d{2})-(\d{2})T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d"
+        r"(?:Z|[+-](?:[01]\d|2[0-3]):?[0-5]\d)",
+        re.ASCII,
+    ),
+    re.compile(r"(\d{4})-(\d{2})-(\d{2})", re.ASCII),  # "YYYY-MM-DD"
+    re.compile(r"(\d{4})/(\d{1,2})()", re.ASCII),  # "YYYY/M"
+    re.compile(r"(\d{4})()()", re.ASCII),  # Year-only format (e.g., "2023")
+)
+
+# The same formats for strptime, used when none of the patterns above match
+_DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S%z",  # Full ISO format with timezone
+    "%Y-%m-%d",  # Date in "YYYY-MM-DD" format
+    "%Y/%m",  # Date in "YYYY/M" format
+    "%Y",  # Year-only format (e.g., "2023")
+)
+
+
+def _is_utc_time(date_str):
+    """Return True if `date_str` is a valid "YYYY-MM-DDTHH:MM:SSZ" time as used by Zotero's `accessDate`."""
+    return (
+        len(date_str) == 20
+        and date_str[10] == "T"
+        and date_str[13] == date_str[16] == ":"
+        and date_str[19] == "Z"
+        and (date_str[11:13] + date_str[14:16] + date_str[17:19]).isdigit()
+        # Fixed-width digits compare like numbers: hour < 24, minute and second < 60
+        and date_str[11:13] < "24"
+        and date_str[14] < "6"
+        and date_str[17] < "6"
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str):
+    """
+    Parse a non-empty date string and format it to "YYYY-MM-DD".
 
-# Create a custom logger specifically for the current module (zotero_to_notion)
-ztn_logger = logging.getLogger(__name__)
-ztn_logger.setLevel(logging.INFO)
+    Args:
+        date_str (str): The date string to be parsed.
+
+    Returns:
+        str or None: The formatted date, or None if no supported format matches.
+    """
+    # Fastest path: Zotero's fixed-position "YYYY-MM-DD" and "YYYY-MM-DDTHH:MM:SSZ" dates are sliced directly
+    # (str.isdigit accepts non-ASCII digits, which strptime rejects)
+    if (
+        date_str.isascii()
+        and (len(date_str) == 10 or _is_utc_time(date_str))
+        and date_str[4] == date_str[7] == "-"
+        and (date_str[:4] + date_str[5:7] + date_str[8:10]).isdigit()
+    ):
+        try:
+            return date(
+                int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10])
+            ).isoformat()
+        except ValueError:
+            pass  # Out-of-range values fall through to the generic parsers below
+
+    # Fast path: extract year/month/day directly instead of trying strptime formats in turn
+    for pattern in _DATE_PATTERNS:
+        match = pattern.fullmatch(date_str)
+        if match:
+            year, month, day = match.groups()
+            try:
+                # `date` validates the values (e.g., month 13) like strptime would
+                return date(int(year), int(month or 1), int(day or 1)).isoformat()
+            except ValueError:
+                break
+
+    for date_format in _DATE_FORMATS:
+        try:
+            # Try to parse the date with the current format
+            parsed_date = datetime.strptime(date_str, date_format)
+
+            # Format the parsed date to "YYYY-MM-DD" for Notion compatibility
+            return parsed_date.strftime("%Y-%m-%d")
+        except ValueError:
+            # If parsing fails, move to the next format
+            continue
+        except Exception as e:
+            ztn_logger.error("An unexpected error occurred: %s", str(e), exc_info=True)
+            raise
+
+    # Return None if no formats match
+    return None
+
+
+def _rich(value):
+    """Wrap a value as a Notion rich_text property (None becomes an empty string)."""
+    return {"rich_text": [{"text": {"content": value or ""}}]}
+
+
+def _multi(names):
+    """Wrap names as a Notion multi_select property, skipping empty names."""
+    return {"multi_select": [{"name": name} for name in names if name]}
+
+
+@lru_cache(maxsize=512)
+def _collection_filters(collection_names):
+    """
+    Build the Notion "contains" filters for a tuple of collection names.
+
+    The result is cached and shared between calls, so callers must not mutate it.
+
+    Args:
+        collection_names (tuple): The collection names to filter by; empty names are skipped.
+
+    Returns:
+        tuple: One multi_select filter per non-empty collection name.
+    """
+    return tuple(
+        {"property": "Collections", "multi_select": {"contains": name}}
+        for name in collection_names
+        if name
+    )
+
+
+def _title_equals(title):
+    """Build the Notion filter matching a page whose Title equals `title`."""
+    return {"property": "Title", "title": {"equals": title}}
+
+
+def _title_filter(title, collection_filters=()):
+    """
+    Build the query payload used by `find_reference_in_notion`.
+
+    Args:
+        title (str): The title to match exactly.
+        collection_filters (tuple): Filters from `_collection_filters`; at least one must match.
+
+    Returns:
+        dict: The query payload, with the collections condition only when filters are given.
+            At most two pages are returned (enough to detect duplicates), most recently edited first.
+    """
+    conditions = [_title_equals(title)]
+    if collection_filters:
+        conditions.append({"or": list(collection_filters)})
+    return {
+        "filter": {"and": conditions},
+        "sorts": _MOST_RECENT_FIRST,
+        "page_size": 2,
+    }
+
+
+def _next_link(response):
+    """Return the URL of the `rel="next"` entry of the response's "Link" header, or None."""
+    for link in response.headers.get("Link", "").split(", "):
+        if 'rel="next' in link:
+            return link.split(";")[0].strip("<>")
+    return None
+
+
+def _log_upsert_failure(future, title):
+    """Log the exception of a failed `_upsert_reference` future, if any."""
+    if future.exception() is not None:
+        ztn_logger.error(
+            "Failed to process reference '%s': %s", title, str(future.exception())
+        )
+
+
+class _CreateRetry(Retry):
+    """A `Retry` whose `Retry-After` handling only applies to 429 (413 and 503 are not retried)."""
+
+    RETRY_AFTER_STATUS_CODES = frozenset([429])
+
+
+def _create_session(headers, pool_maxsize=10, create_url=None):
+    """
+    Create a `requests.Session` with default headers and a pooled, retrying adapter.
+
+    Reusing one session per API keeps the TCP/TLS connection alive across requests
+    instead of performing a new handshake for every call.
+
+    Args:
+        headers (dict): Headers sent with every request made through the session.
+        pool_maxsize (int): The number of connections kept open to the API host; match it to
+            the number of threads using the session to avoid discarding connections. Defaults to 10.
+        create_url (str, optional): The URL of a non-idempotent POST endpoint. A request to it
+            that timed out or failed with a 5xx may still have been processed, so it is only
+            retried on 429, which is rejected before processing. Defaults to None.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+
+    # Retry rate limits and transient failures, waiting for Retry-After when the API sends it.
+    # POST/PATCH are included because Notion rate-limits its writes and queries.
+    # The last response is returned so callers can still inspect its status.
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["GET", "POST", "PATCH"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    # Each session only talks to a single host, so one connection pool is enough
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry
+    )
+    session.mount("https://", adapter)
+
+    if create_url:
+        # Connection errors are still retried since the request never reached the API
+        create_retry = _CreateRetry(
+            total=5,
+            read=0,
+            other=0,
+            backoff_factor=0.5,
+            status_forcelist=[429],
+            allowed_methods=frozenset(["POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        session.mount(
+            create_url,
+            HTTPAdapter(
+                pool_connections=1, pool_maxsize=pool_maxsize, max_retries=create_retry
+            ),
+        )
+        # Longer prefixes win, so URLs below the create URL (e.g., a page ID) keep the full retries
+        session.mount(create_url + "/", adapter)
+
+    return session
 
 
 class ZoteroToNotion:
@@ -31,94 +303,220 @@ class ZoteroToNotion:
     This class provides methods to fetch references from Zotero, format data,
     and either add or update these references in a specified Notion database.
     It integrates with the Notion and Zotero APIs to facilitate the synchronization process.
+
+    The HTTP sessions are kept open for the lifetime of the instance; use it as a context
+    manager (or call `close()`) to release the pooled connections.
+
+    An optional `SyncCache` (see `sync_cache.py`) records the Zotero version and collection
+    names written to Notion for each item, so later syncs skip items that have not changed.
     """
 
-    def __init__(self, cfg):
+    def __init__(self, cfg, max_workers=NOTION_MAX_WORKERS, cache=None):
         self.config = cfg
+        self.max_workers = max_workers
+
+        # Optional SyncCache of the item versions already written to Notion (owned by the caller)
+        self.cache = cache
+
+        # Prefetched {title: [(page_id, frozenset(collection names)), ...]} of the Notion database,
+        # only populated while `sync_all_references_to_notion` runs
+        self._notion_index = None
+        self._notion_index_lock = threading.Lock()
+        # References with the same title are looked up and written one at a time (see
+        # `_upsert_reference`); titles are spread over a fixed set of locks to bound memory
+        self._title_locks = [threading.Lock() for _ in range(64)]
         self.zotero_headers = {"Zotero-API-Key": self.config.ZOTERO_API_KEY}
         self.notion_headers = {
             "Authorization": f"Bearer {self.config.NOTION_API_KEY}",
-            "Content-Type": "application/json",
             "Notion-Version": "2022-06-28",
         }
+        self._search_url = f"https://api.notion.com/v1/databases/{self.config.NOTION_DATABASE_ID}/query"
+        # Shared by every page payload (requests only serializes it, so it is never mutated)
+        self._parent = {"database_id": self.config.NOTION_DATABASE_ID}
+
+        # One pooled session per API so connections are reused across requests
+        self.zotero_session = _create_session(
+            self.zotero_headers, pool_maxsize=ZOTERO_MAX_WORKERS
+        )
+        # Every sync worker holds a Notion connection, and the main thread queries Notion while
+        # they write (see `_lookup_titles`), so the pool has one connection more than the thread pool
+        self.notion_session = _create_session(
+            self.notion_headers,
+            pool_maxsize=max(max_workers, 1) + 1,
+            create_url=_NOTION_PAGES_URL,
+        )
+
+    def close(self):
+        """Close the HTTP sessions and release their pooled connections."""
+        self.zotero_session.close()
+        self.notion_session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def fetch_zotero_reference(self):
         """
         Fetch references from Zotero using the Zotero API.
 
-        This method sends a GET request to the Zotero API to retrieve references
-        for a specific user in JSON format. It logs the process of fetching data
-        and checks if the response is valid.
+        This method collects the references yielded by `iter_zotero_references` into a list.
+        References are validated once at ingestion, so every returned item is a dictionary
+        whose 'data' value is a dictionary.
 
         Returns:
-            list or dict: A list of references if the request is successful, or an empty list if the status code is not 200. If the response cannot be parsed as JSON, an empty dictionary is returned.
-
-        Raises:
-            ValueError: If the response content cannot be parsed as JSON.
+            list: A list of references. If a page request fails or its response cannot be
+                parsed as JSON, the references fetched before the failure are returned.
 
         Note:
-            The method assumes the `ZOTERO_USER_ID` and `zotero_headers` are
+            The method assumes the `ZOTERO_USER_ID` and `zotero_session` are
             already defined in the class.
 
         Example:
             references = self.fetch_zotero_reference()
         """
 
+        references = list(self.iter_zotero_references())
+        if ztn_logger.isEnabledFor(logging.DEBUG):
+            ztn_logger.debug("Total references fetched: %s", len(references))
+            ztn_logger.debug("References: %s", references)
+
+        return references
+
+    def iter_zotero_references(self, query=None):
+        """
+        Lazily yield references from Zotero, one page of up to 100 items at a time.
+
+        The first page is requested on its own; its `Total-Results` header gives the number
+        of remaining pages, which are then fetched by `start` offset on a small thread pool
+        (at most `ZOTERO_MAX_WORKERS` requests ahead of the consumer) and yielded in order.
+        Without that header, the `rel="next"` link of each response is followed instead.
+        References are validated as they arrive: malformed entries (not a dictionary, or
+        without a dictionary under 'data') are skipped with a warning, and an invalid
+        'creators' list is replaced by an empty one so it is not re-validated downstream.
+
+        Args:
+            query (dict, optional): Extra Zotero query parameters (e.g., `{"q": title}` for a
+                quick search) added to every page request. Defaults to None.
+
+        Yields:
+            dict: A reference whose 'data' key holds a dictionary.
+
+        Note:
+            Iteration stops (after logging an error) if a page request fails or its
+            response cannot be parsed as JSON.
+
+        Example:
+            for reference in self.iter_zotero_references():
+                ...
+        """
+
         ztn_logger.debug("Fetching Zotero references...")
-        base_url = f"https://api.zotero.org/users/{self.config.ZOTERO_USER_ID}/items"
-        params = {"format": "json"}
+        url = f"https://api.zotero.org/users/{self.config.ZOTERO_USER_ID}/items"
+        params = {"format": "json", "limit": ZOTERO_PAGE_SIZE, **(query or {})}
 
-        all_items = []  # Store all fetched items
-        next_url = base_url  # Start with the base URL
+        result = self._fetch_zotero_page(url, params)
+        if result is None:
+            return
+        response, page = result
+        yield from page
 
-        while next_url:
-            ztn_logger.debug("Next URL: %s", next_url)
-            response = requests.get(
-                next_url, headers=self.zotero_headers, params=params, timeout=30
-            )
+        try:
+            total = int(response.headers["Total-Results"])
+        except (KeyError, TypeError, ValueError):
+            total = None
+
+        if total is None:
+            # Fall back to following the "next" links one page at a time
+            next_url = _next_link(response)
+            while next_url:
+                # The "next" link already carries the query parameters
+                result = self._fetch_zotero_page(next_url)
+                if result is None:
+                    return
+                response, page = result
+                next_url = _next_link(response)
+                yield from page
+            return
 
-            # Check if the request is valid
-            if response.status_code != 200:
-                ztn_logger.error(
-                    "Failed to fetch Zotero references. Status code: %s",
-                    response.status_code,
-                )
-                return []
+        # Fetch the remaining pages concurrently, keeping a bounded number in flight
+        offsets = iter(range(ZOTERO_PAGE_SIZE, total, ZOTERO_PAGE_SIZE))
+        executor = ThreadPoolExecutor(max_workers=ZOTERO_MAX_WORKERS)
 
-            try:
-                # Add fetched items
-                response_data = response.json()
-                all_items.extend(response_data)
+        def submit(offset):
+            return executor.submit(
+                self._fetch_zotero_page, url, {**params, "start": offset}
+            )
 
-                # Check if a "next" page exists in the "Link" header
-                if "Link" in response.headers:
-                    links = response.headers["Link"].split(", ")
-                    next_url = None  # Reset next_url
+        try:
+            pending = deque(map(submit, islice(offsets, ZOTERO_MAX_WORKERS)))
+            while pending:
+                result = pending.popleft().result()
+                if result is None:
+                    return
+                pending.extend(map(submit, islice(offsets, 1)))
+                yield from result[1]
+        finally:
+            # Don't start requests for pages that will never be consumed
+            executor.shutdown(cancel_futures=True)
+
+    def _fetch_zotero_page(self, url, params=None):
+        """
+        Fetch and validate one page of Zotero references.
 
-                    for link in links:
-                        if 'rel="next' in link:
-                            next_url = link.split(";")[0].strip("<>")
-                            break
-                else:
-                    next_url = None  # No more pages
+        Args:
+            url (str): The items URL (or a "next" link, which already carries the query parameters).
+            params (dict): The query parameters, if any. Defaults to None.
 
-                ztn_logger.debug("Current fetched count: %s", len(all_items))
+        Returns:
+            tuple or None: The response and its valid references, or None (after logging an
+                error) if the request failed or the response could not be parsed as JSON.
+        """
+        ztn_logger.debug("Fetching %s with %s", url, params)
+        response = self.zotero_session.get(url, params=params, timeout=30)
+
+        # Check if the request is valid
+        if response.status_code != 200:
+            ztn_logger.error(
+                "Failed to fetch Zotero references. Status code: %s",
+                response.status_code,
+            )
+            return None
 
-            except ValueError:
-                ztn_logger.error(
-                    "Failed to parse response: %s", response.text, exc_info=True
-                )
-                return []
+        try:
+            response_data = response.json()
+        except ValueError:
+            ztn_logger.error(
+                "Failed to parse response: %s", response.text, exc_info=True
+            )
+            return None
+        except Exception as e:
+            ztn_logger.error("An unexpected error occurred: %s", str(e), exc_info=True)
+            raise
 
-            except Exception as e:
-                ztn_logger.error(
-                    "An unexpected error occurred: %s", str(e), exc_info=True
+        # Validate once at ingestion so downstream methods can rely on reference["data"]
+        page = [
+            reference
+            for reference in filter_valid(response_data)
+            if isinstance(reference["data"], dict)
+        ]
+        if len(page) != len(response_data):
+            ztn_logger.warning(
+                "Skipped %d malformed references.", len(response_data) - len(page)
+            )
+        for reference in page:
+            reference_data = reference["data"]
+            if not validate_creators_list(reference_data.get("creators", [])):
+                ztn_logger.warning(
+                    "Ignoring invalid creators for '%s'.",
+                    reference_data.get("title"),
                 )
-                raise
+                reference_data["creators"] = []
 
-        ztn_logger.debug("Total references fetched: %s", all_items)
-        ztn_logger.debug("References: %s", all_items)
-        return all_items
+        ztn_logger.debug("Fetched %d references", len(response_data))
+
+        return response, page
 
     def fetch_collections(self):
         """
@@ -137,7 +535,7 @@ class ZoteroToNotion:
             ValueError: If the response content cannot be parsed as JSON.
 
         Note:
-            The method assumes the `ZOTERO_USER_ID` and `zotero_headers` are
+            The method assumes the `ZOTERO_USER_ID` and `zotero_session` are
             already defined in the class.
 
         Example:
@@ -145,12 +543,14 @@ class ZoteroToNotion:
         """
 
         url = f"https://api.zotero.org/users/{self.config.ZOTERO_USER_ID}/collections"
-        response = requests.get(url, headers=self.zotero_headers, timeout=30)
+        response = self.zotero_session.get(url, timeout=30)
+        debug_enabled = ztn_logger.isEnabledFor(logging.DEBUG)
 
         # Check if the request returns a valid response
         try:
             response_data = response.json()
-            ztn_logger.debug("All Collections: %s", response_data)
+            if debug_enabled:
+                ztn_logger.debug("All Collections: %s", response_data)
         except ValueError:
             ztn_logger.error("Failed to parse JSON response: %s", response.text)
             return {}
@@ -163,25 +563,17 @@ class ZoteroToNotion:
 
         if response.status_code == 200 and response_data:
             for collection in response_data:
-                ztn_logger.debug("Collection Key: %s", collection["key"])
-                ztn_logger.debug("Collection Data: %s", collection["data"])
-                ztn_logger.debug("Collection Name: %s", collection["data"]["name"])
-                ztn_logger.debug("Response Data Type: %s", type(collection))
-                ztn_logger.debug("Collection Data Type: %s", type(collection["data"]))
-
-                if (
-                    isinstance(collection, dict)
-                    and "key" in collection
-                    and "data" in collection
-                    and isinstance(collection["data"], dict)
-                    and "name" in collection["data"]
-                ):
+                # EAFP: a single lookup covers the dict/key/name checks on the happy path
+                try:
                     collections[collection["key"]] = collection["data"]["name"]
-                    ztn_logger.debug("Collection: %s", collection)
-                else:
+                except (KeyError, TypeError):
                     ztn_logger.warning(
                         "Skipping invalid collection format: %s", collection
                     )
+                    continue
+
+                if debug_enabled:
+                    ztn_logger.debug("Collection: %s", collection)
         else:
             ztn_logger.warning(
                 "Failed to fetch collections or received an empty response."
@@ -220,39 +612,23 @@ class ZoteroToNotion:
             - "YYYY-MM-DD"
             - "YYYY/M"
             - "YYYY"
+            Precompiled regular expressions handle the common shapes of these formats
+            without `strptime`; `strptime` remains as a fallback for the remaining variants.
+            Results are cached per date string (see `_parse_date`).
         """
         # Check for empty or Non date strings and return None immediately
         if not date_str:
             ztn_logger.warning("Date string is empty or None.")
             return None
-        # Define the date format to try, from most to lease specific
-        date_formats = [
-            "%Y-%m-%dT%H:%M:%S%z",  # Full ISO format with timezone
-            # (e.g., "2023-05-15T13:34:41+00:00")
-            "%Y-%m-%d",  # Date in "YYYY-MM-DD" format
-            "%Y/%m",  # Date in "YYYY/M" format
-            "%Y",  # Year-only format (e.g., "2023")
-        ]
-        for date_format in date_formats:
-            try:
-                # Try to parse the date with the current format
-                parsed_date = datetime.strptime(date_str, date_format)
 
-                # Format the parsed date to "YYYY-MM-DD" for Notion compatibility
-                return parsed_date.strftime("%Y-%m-%d")
-            except ValueError:
-                # If parsing fails, move to the next format
-                continue
-            except Exception as e:
-                ztn_logger.error(
-                    "An unexpected error occurred: %s", str(e), exc_info=True
-                )
-                raise
-        # Log a warning if no formats match
-        ztn_logger.warning("Failed to parse date: %s. No formats match!", date_str)
+        # Parsing is memoized since the same dates repeat across many references
+        parsed_date = _parse_date(date_str)
 
-        # Return None if no formats match
-        return None
+        if parsed_date is None:
+            # Log a warning if no formats match
+            ztn_logger.warning("Failed to parse date: %s. No formats match!", date_str)
+
+        return parsed_date
 
     @validate_creators()
     def format_authors(self, creators):
@@ -277,21 +653,18 @@ class ZoteroToNotion:
                                 required keys.
         """
 
-        authors = []
-
-        for creator in creators:
-            # if isinstance(creator, dict) and 'name' in creator and creator['name']:
-            if "name" in creator and creator["name"]:
-                # Organizational author or single name field
-                authors.append(creator["name"])
-            else:
-                # Individual author with firstName and lastName
-                fullname = (
-                    f"{creator.get('firstName', '')} {creator.get('lastName', '')}"
-                )
-                authors.append(fullname)
+        # Organizational authors (single name field) use 'name'; individuals use firstName and lastName
+        return ", ".join(
+            (
+                creator["name"]
+                if creator.get("name")
+                else f"{creator.get('firstName', '')} {creator.get('lastName', '')}".strip()
+            )
+            for creator in creators
+        )
 
-        return ", ".join(authors)
+    # Undecorated variant for creators already checked in `iter_zotero_references`
+    _format_authors_unchecked = format_authors.__wrapped__
 
     def format_collection_names(self, collection_ids, collections):
         """
@@ -306,8 +679,9 @@ class ZoteroToNotion:
             collections (dict): A dictionary where keys are collection IDs and values are collection names.
 
         Returns:
-            list: A list of collection names corresponding to the provided collection IDs. Returns an
-                empty list if the input is invalid or if no matching names are found.
+            list: A list of collection names corresponding to the provided collection IDs; IDs without a
+                known name are skipped. Returns an empty list if the input is invalid or if no matching
+                names are found.
 
         Logs:
             - Debug logs for the input collection IDs and collections dictionary.
@@ -315,16 +689,14 @@ class ZoteroToNotion:
         """
 
         # Check if collection_ids is a list containing values and collections is a dictionary
-        if len(collection_ids) > 0 and isinstance(collections, dict):
-            ztn_logger.debug("Collection IDs: %s", collection_ids)
-            ztn_logger.debug("Collections: %s", collections)
-
-            # Change the list of collection ids to that of collection names
-            collection_names = [
-                collections.get(collection_id, "") for collection_id in collection_ids
-            ]
+        if collection_ids and isinstance(collections, dict):
+            if ztn_logger.isEnabledFor(logging.DEBUG):
+                ztn_logger.debug("Collection IDs: %s", collection_ids)
+                ztn_logger.debug("Collections: %s", collections)
 
-            return collection_names
+            # Change the list of collection ids to that of collection names (lookups run in C);
+            # unknown IDs are dropped so callers don't have to filter empty names
+            return list(filter(None, map(collections.get, collection_ids)))
 
         ztn_logger.warning(
             "Failed to format collection names. Collection IDs: %s, Collections: %s.",
@@ -344,23 +716,69 @@ class ZoteroToNotion:
         Returns:
             str: The truncated abstractNote with a maximum of 2000 characters.
         """
-        abstract = reference.get("data", {}).get("abstractNote", "")
-        if abstract and isinstance(abstract, str):
-            if len(abstract) > 2000:
-                ztn_logger.warning(
-                    "Abstract is too long and has been truncated to 2000 characters."
-                )
-                truncated_abstract = abstract[:1997] + "..."
-                ztn_logger.debug("Truncated Abstract: %s", truncated_abstract)
-                return truncated_abstract
-
-            ztn_logger.debug("Valid Abstract: %s", abstract)
+        # Zotero always returns abstractNote as a string, so only a missing/empty value needs handling
+        abstract = reference.get("data", {}).get("abstractNote") or ""
+        if len(abstract) <= 2000:
             return abstract
-        else:
-            return ""
+
+        ztn_logger.warning(
+            "Abstract is too long and has been truncated to 2000 characters."
+        )
+        return abstract[:1997] + "..."
+
+    def _build_properties(self, reference, collection_names):
+        """
+        Build the Notion properties shared by new and updated references.
+
+        Args:
+            reference (dict): A reference returned by `fetch_zotero_reference`.
+            collection_names (list): A list of collection names to be associated with the Notion entry.
+
+        Returns:
+            dict: The Notion properties, including the title and, only when they are valid,
+                the date fields.
+        """
+        reference_data = reference["data"]
+
+        # Format Access Date and Publication Date to be compatible with Notion: YYYY-MM-DD
+        access_date = self.parse_date(reference_data.get("accessDate", ""))
+        publication_date = self.parse_date(reference_data.get("date", ""))
+
+        properties = {
+            # Sent on updates too, so a page updated through its cached ID follows a renamed item
+            "Title": {"title": [{"text": {"content": reference_data["title"]}}]},
+            "Collections": _multi(collection_names),
+            # Format Authors (comma-separated string)
+            # Creators were validated at ingestion, so skip the decorator
+            "Authors": _rich(
+                self._format_authors_unchecked(reference_data.get("creators", []))
+            ),
+            "Source URL": {"url": reference_data.get("url", "")},
+            # _multi drops missing/empty tag names
+            "Tags": _multi(
+                tag.get("tag")
+                for tag in reference_data.get("tags", [])
+                if isinstance(tag, dict)
+            ),
+            "Item Type": {"select": {"name": reference_data.get("itemType", "")}},
+            # Books generally have publishers
+            "Publisher": _rich(reference_data.get("publisher")),
+            # Besides books, Publisher is sometimes shown in the extra field (journalArticle type for example)
+            "Extra": _rich(reference_data.get("extra")),
+            "DOI": _rich(reference_data.get("DOI")),
+            # Process Abstract (truncated to 2000 characters if too long)
+            "Abstract": _rich(self.process_abstract(reference)),
+        }
+
+        # Conditionally add date fields only if they have valid values
+        if access_date:
+            properties["Date Accessed"] = {"date": {"start": access_date}}
+        if publication_date:
+            properties["Publication Date"] = {"date": {"start": publication_date}}
+
+        return properties
 
     # Method to update a reference in Notion if it already exists
-    @validate_reference_with_key()
     def update_reference_in_notion(self, page_id, reference, collection_names):
         """
         Update an existing reference in Notion with formatted data from Zotero.
@@ -371,15 +789,15 @@ class ZoteroToNotion:
 
         Args:
             page_id (str): The ID of the Notion page to update.
-            reference (dict): A dictionary containing data from a Zotero reference. The 'data' key must be present.
+            reference (dict): A reference returned by `fetch_zotero_reference`, so the 'data' key is present.
             collection_names (list): A list of collection names to be associated with the Notion entry.
 
         Returns:
-            None
+            int: The HTTP status code of the update (200 on success; 404, or 400 for an archived
+                page, when the page is gone).
 
         Raises:
             ValueError: If the response cannot be parsed as JSON.
-            KeyError: If expected keys are missing in the reference data (handled by the decorator).
             Exception: For unexpected errors during the request.
 
         Logs:
@@ -388,79 +806,23 @@ class ZoteroToNotion:
             - Warnings and debug logs may be present from helper methods for specific data processing.
         """
 
-        # Format Access Date and Publication Date to be compatible with Notion: YYYY-MM-DD
-        access_date = self.parse_date(reference["data"].get("accessDate", ""))
-        publication_date = self.parse_date(reference["data"].get("date", ""))
-
-        # Format Authors (comma-separated string)
-        authors = self.format_authors(reference["data"].get("creators", []))
-
-        # Process Abstract (truncated to 2000 characters if too long)
-        abstract = self.process_abstract(reference)
-
         # Prepare data to upload in Notion
         data = {
-            "parent": {"database_id": self.config.NOTION_DATABASE_ID},
-            "properties": {
-                "Collections": {
-                    "multi_select": [
-                        {"name": collection_name}
-                        for collection_name in collection_names
-                        if collection_name
-                    ]
-                },
-                "Authors": {"rich_text": [{"text": {"content": authors}}]},
-                "Source URL": {"url": reference["data"].get("url", "")},
-                "Tags": {
-                    "multi_select": [
-                        {"name": tag["tag"]}
-                        for tag in reference["data"].get("tags", [])
-                        if isinstance(tag, dict) and "tag" in tag
-                    ]
-                },
-                "Item Type": {
-                    "select": {"name": reference["data"].get("itemType", "")}
-                },
-                # Books generally have publishers
-                "Publisher": {
-                    "rich_text": [
-                        {"text": {"content": reference["data"].get("publisher", "")}}
-                    ]
-                },
-                # Besides books, Publisher is sometimes shown in the extra field (journalArticle type for example)
-                "Extra": {
-                    "rich_text": [
-                        {"text": {"content": reference["data"].get("extra", "")}}
-                    ]
-                },
-                "DOI": {
-                    "rich_text": [
-                        {"text": {"content": reference["data"].get("DOI", "")}}
-                    ]
-                },
-                "Abstract": {"rich_text": [{"text": {"content": abstract}}]},
-            },
+            "parent": self._parent,
+            "properties": self._build_properties(reference, collection_names),
         }
-        ztn_logger.debug("Data: %s", data)
-
-        # Conditionally add date fields only if they have valid values
-        if access_date:
-            data["properties"]["Date Accessed"] = {"date": {"start": access_date}}
-        if publication_date:
-            data["properties"]["Publication Date"] = {
-                "date": {"start": publication_date}
-            }
+        if ztn_logger.isEnabledFor(logging.DEBUG):
+            ztn_logger.debug("Data: %s", data)
 
         # Send update request to Notion
-        url = f"https://api.notion.com/v1/pages/{page_id}"
+        url = f"{_NOTION_PAGES_URL}/{page_id}"
 
         # Check if the request returns a valid response
         try:
-            response = requests.patch(
-                url, headers=self.notion_headers, data=json.dumps(data), timeout=30
-            )
+            response = self.notion_session.patch(url, json=data, timeout=30)
             response_data = response.json()
-            ztn_logger.debug(response_data)
+            if ztn_logger.isEnabledFor(logging.DEBUG):
+                ztn_logger.debug(response_data)
         except ValueError:
             ztn_logger.error("Failed to parse response: %s", response.text)
             raise  # Parsing error needs to be handled by the caller
@@ -471,6 +833,8 @@ class ZoteroToNotion:
             ztn_logger.error("An unexpected error occurred: %s", str(e), exc_info=True)
             raise
 
+        return response.status_code
+
         # # Check if the request was successful - this is a HIGHT LEVEL log which can be handled in the caller (like sync_reference_to_notion) instead
         # if response.status_code == 200:
         #     ztn_logger.info("Updated '%s' in Notion.", reference["data"]["title"])
@@ -479,118 +843,62 @@ class ZoteroToNotion:
         #         "Failed to update '%s': %s", reference["data"]["title"], response_data
         #     )
 
-    @validate_reference_with_key()
-    def add_reference_to_notion(self, reference, collection_names):
+    def add_reference_to_notion(self, reference, collection_names, page_id=None):
         """
-        Adds a reference to the Notion database or updates it if it already exists.
+        Adds a reference to the Notion database, or updates the page given as `page_id`.
 
-        This method checks if a reference already exists in the specified Notion database
-        by matching the title and collection names. If it exists, the reference is updated.
-        If it does not exist, the method creates a new entry with formatted data, including
-        authors, dates, and other metadata.
+        The method no longer searches Notion for an existing entry: the caller looks the
+        reference up once (see `_find_page_id` or `find_reference_in_notion`) and passes the
+        result as `page_id`. If a page ID is given, that page is updated; otherwise a new entry
+        is always created with formatted data, including authors, dates, and other metadata,
+        so calling it without `page_id` for a reference already in Notion adds a duplicate.
 
         Args:
             reference (dict): The reference data dictionary containing relevant metadata
-                            (e.g., title, authors, date).
+                            (e.g., title, authors, date), as validated by `fetch_zotero_reference`.
             collection_names (list): A list of collection names associated with the reference.
+            page_id (str, optional): The ID of the existing Notion page, if any. Defaults to None.
 
         Returns:
-            None: The method performs operations and logs results but does not return any value.
+            str or None: The ID of the updated or created page, or None if the request failed
+                (the failure is logged with the title and status).
 
         Raises:
             ValueError: If the response from the Notion API cannot be parsed.
-            InvalidReferenceError: Raised by the decorator if the reference data is missing
-                                the required key or format.
         """
 
-        # Check if the reference already exists in Notion by retrieving its ID (a.k.a, page ID)
-        page_id = self.find_reference_in_notion(
-            reference["data"]["title"], collection_names
-        )
-
-        # Initialize variables
-        authors = ""
-        access_date = None
-        publication_date = None
-
         if page_id:
             # If it exists, update the entry
-            self.update_reference_in_notion(page_id, reference, collection_names)
-            return
+            status = self.update_reference_in_notion(
+                page_id, reference, collection_names
+            )
+            if status != 200:
+                ztn_logger.error(
+                    "Failed to update '%s' in Notion (status %s).",
+                    reference["data"]["title"],
+                    status,
+                )
+                return None
+            self._add_to_notion_index(
+                reference["data"]["title"], page_id, collection_names
+            )
+            return page_id
 
         # If it doesn't exist, create a new entry
-        # Format Access Data and Publication Date to be compatible with Notion: YYYY-MM-DD
-        access_date = self.parse_date(reference["data"].get("accessDate", ""))
-        publication_date = self.parse_date(reference["data"].get("date", ""))
-
-        # Format Authors (comma-separated string)
-        authors = self.format_authors(reference["data"].get("creators", []))
-
-        # Process Abstract (truncated to 2000 characters if too long)
-        abstract = self.process_abstract(reference)
+        properties = self._build_properties(reference, collection_names)
+        # Set a default value for the Status and Category field
+        properties.update(_NEW_PAGE_DEFAULTS)
 
         # Prepare the data for Notion
         data = {
-            "parent": {"database_id": self.config.NOTION_DATABASE_ID},
-            "properties": {
-                "Title": {"title": [{"text": {"content": reference["data"]["title"]}}]},
-                "Collections": {
-                    "multi_select": [
-                        {"name": collection_name}
-                        for collection_name in collection_names
-                        if collection_name
-                    ]
-                },
-                "Authors": {"rich_text": [{"text": {"content": authors}}]},
-                "Source URL": {"url": reference["data"].get("url", "")},
-                "Tags": {
-                    "multi_select": [
-                        {"name": tag["tag"]}
-                        for tag in reference["data"].get("tags", [])
-                        if isinstance(tag, dict) and "tag" in tag
-                    ]
-                },
-                "Item Type": {
-                    "select": {"name": reference["data"].get("itemType", "")}
-                },
-                # Books generally have publishers
-                "Publisher": {
-                    "rich_text": [
-                        {"text": {"content": reference["data"].get("publisher", "")}}
-                    ]
-                },
-                # Besides books, Publisher is sometimes shown in the extra field (journalArticle type for example)
-                "Extra": {
-                    "rich_text": [
-                        {"text": {"content": reference["data"].get("extra", "")}}
-                    ]
-                },
-                "DOI": {
-                    "rich_text": [
-                        {"text": {"content": reference["data"].get("DOI", "")}}
-                    ]
-                },
-                "Abstract": {"rich_text": [{"text": {"content": abstract}}]},
-                # Set a default value for the Status and Category field
-                "Status": {"status": {"name": "Not started"}},
-                "Category": {"select": {"name": "Academic"}},
-            },
+            "parent": self._parent,
+            "properties": properties,
         }
 
-        # Conditionally add date fields only if they have valid values
-        if access_date:
-            data["properties"]["Date Accessed"] = {"date": {"start": access_date}}
-        if publication_date:
-            data["properties"]["Publication Date"] = {
-                "date": {"start": publication_date}
-            }
-
         # Send data to Notion
-        url = "https://api.notion.com/v1/pages"
+        url = _NOTION_PAGES_URL
 
-        response = requests.post(
-            url, headers=self.notion_headers, data=json.dumps(data), timeout=30
-        )
+        response = self.notion_session.post(url, json=data, timeout=30)
 
         # Check if the request returns a valid response
         try:
@@ -598,11 +906,23 @@ class ZoteroToNotion:
             # ztn_logger.debug(response_data)
         except ValueError:
             ztn_logger.error("Failed to parse response: %s", response.text)
-            return
+            return None
         except Exception as e:
             ztn_logger.error("An unexpected error occurred: %s", str(e), exc_info=True)
             raise
 
+        if response.status_code != 200 or not isinstance(response_data, dict):
+            ztn_logger.error(
+                "Failed to add '%s' to Notion (status %s).",
+                reference["data"]["title"],
+                response.status_code,
+            )
+            return None
+
+        # Keep the prefetched index current so later references see the new page
+        page_id = response_data.get("id")
+        self._add_to_notion_index(reference["data"]["title"], page_id, collection_names)
+
         # # Check if the request was successful
         # if response.status_code == 200:
         #     ztn_logger.info("Added '%s' to Notion.", reference["data"]["title"])
@@ -611,6 +931,8 @@ class ZoteroToNotion:
         #         "Failed to add '%s': %s", reference["data"]["title"], response_data
         #     )
 
+        return page_id
+
     def find_reference_in_notion(self, title, collection_names):
         """
         Finds a reference in the Notion database based on the title and collection names.
@@ -618,7 +940,7 @@ class ZoteroToNotion:
         This method constructs a query payload and sends a request to the Notion API
         to search for a specific reference by matching the title and, optionally, the
         collection names. If multiple matches are found, a warning is logged and the
-        first match is returned.
+        most recently edited match is returned.
 
         Args:
             title (str): The title of the reference to search for.
@@ -628,7 +950,8 @@ class ZoteroToNotion:
             str or None: The page ID of the found reference if it exists; None if no match is found.
 
         Raises:
-            ValueError: If the response from the Notion API cannot be parsed.
+            NotionQueryError: If the query fails (non-200 status, or a response that cannot be
+                parsed or has no results list), so a failed search is never mistaken for "not found".
             Exception: Logs and raises any unexpected errors during the search process.
 
         Logs:
@@ -638,78 +961,258 @@ class ZoteroToNotion:
 
         """
 
-        search_url = f"https://api.notion.com/v1/databases/{self.config.NOTION_DATABASE_ID}/query"
-        ztn_logger.debug("Search URL: %s", search_url)
+        search_url = self._search_url
+        debug_enabled = ztn_logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            ztn_logger.debug("Search URL: %s", search_url)
 
-        # Construct filters for each collection name
-        collection_filters = []
+        # Construct filters for each collection name (cached per distinct list of names)
+        collection_filters = ()
 
         if collection_names:
-            collection_filters = [
-                {"property": "Collections", "multi_select": {"contains": name}}
-                for name in collection_names
-                if name
-            ]
-            ztn_logger.debug("Collection filters: %s", collection_filters)
+            collection_filters = _collection_filters(tuple(collection_names))
+            if debug_enabled:
+                ztn_logger.debug("Collection filters: %s", collection_filters)
 
         # Build the payload to check for a title match and at least one collection match
-        search_payload = {
-            "filter": {
-                "and": [
-                    {"property": "Title", "title": {"equals": title}},
-                ]
-            }
-        }
+        search_payload = _title_filter(title, collection_filters)
 
-        # Add the collections filter only if necessary
-        if collection_filters:
-            search_payload["filter"]["and"].append({"or": collection_filters})
+        if debug_enabled:
+            ztn_logger.debug("Search payload: %s", search_payload)
 
-        ztn_logger.debug("Search payload: %s", search_payload)
-
-        response = requests.post(
+        # Only the page IDs are read, so ask for the title property alone (its ID is always "title")
+        response = self.notion_session.post(
             search_url,
-            headers=self.notion_headers,
-            data=json.dumps(search_payload),
+            params={"filter_properties": "title"},
+            json=search_payload,
             timeout=30,
         )
 
         # Check if the request returns a valid response
         try:
             response_data = response.json()
-            ztn_logger.debug("Response data parsed: %s", response_data)
-        except ValueError:
+            if debug_enabled:
+                ztn_logger.debug("Response data parsed: %s", response_data)
+        except ValueError as e:
             ztn_logger.error("Failed to parse response: %s", response.text)
-            return None
+            raise NotionQueryError(f"Unparsable response for '{title}'") from e
         except Exception as e:
             ztn_logger.error("An unexpected error occurred: %s", str(e), exc_info=True)
             raise
 
-        if response.status_code == 200 and response_data:
-            # Check if the result is a dictionary and has the required keys
-            if (
-                isinstance(response_data, dict)
-                and "results" in response_data
-                and isinstance(response_data["results"], list)
-            ):
-                results = response_data["results"]
-                ztn_logger.debug("Search Results: %s", results)
+        # Check if the result is a dictionary and has the required keys
+        if (
+            response.status_code != 200
+            or not isinstance(response_data, dict)
+            or not isinstance(response_data.get("results"), list)
+        ):
+            ztn_logger.error(
+                "Failed to search for '%s' (status %s): %s",
+                title,
+                response.status_code,
+                response_data,
+            )
+            raise NotionQueryError(
+                f"Query for '{title}' failed with status {response.status_code}"
+            )
+
+        results = response_data["results"]
+        if debug_enabled:
+            ztn_logger.debug("Search Results: %s", results)
+
+        # Log a warning in case there are more than one result for the same title and collections
+        if len(results) > 1:
+            ztn_logger.warning(
+                "Multiple entries found for title: '%s' and collections: '%s'. Returning the most recently edited match.",
+                title,
+                collection_names,
+            )
+
+        # If a result is found, return the page ID for updating using the update_reference_in_notion method
+        if results:
+            ztn_logger.debug("Page ID: %s", results[0]["id"])
+            return results[0][
+                "id"
+            ]  # Generally, there shouldn't be duplicated entries, so there should only be one match (hence choosing the first match)
+        return None
+
+    def _build_notion_index(self):
+        """
+        Fetch every page of the Notion database once and index it by title.
+
+        The database is queried with `start_cursor` pagination (100 pages per request), so
+        looking up N references costs ceil(total_pages / 100) requests instead of N queries.
+
+        Returns:
+            dict or None: A dictionary mapping each title to a list of
+                `(page_id, frozenset(collection_names))` tuples, or None if the database
+                could not be fetched (callers then fall back to `find_references_bulk`).
+        """
+
+        index = self._query_notion_pages(
+            {"sorts": _MOST_RECENT_FIRST, "page_size": 100}
+        )
+
+        if index is not None:
+            ztn_logger.debug("Prefetched %d titles from Notion", len(index))
+        return index
+
+    def find_references_bulk(self, titles):
+        """
+        Find the Notion pages for many titles using batched `or` queries.
+
+        Titles are grouped `NOTION_TITLES_PER_QUERY` at a time into a single query, which
+        is far fewer requests than one `find_reference_in_notion` call per title when the
+        whole database is too large to prefetch.
+
+        Args:
+            titles (iterable): The titles of the references to search for.
+
+        Returns:
+            dict or None: A dictionary mapping each found title to a list of
+                `(page_id, frozenset(collection_names))` tuples, or None if a query failed.
+        """
+
+        unique_titles = list(dict.fromkeys(titles))
+        index = {}
+
+        for start in range(0, len(unique_titles), NOTION_TITLES_PER_QUERY):
+            payload = {
+                "filter": {
+                    "or": [
+                        _title_equals(title)
+                        for title in unique_titles[
+                            start : start + NOTION_TITLES_PER_QUERY
+                        ]
+                    ]
+                },
+                "sorts": _MOST_RECENT_FIRST,
+                "page_size": 100,
+            }
+            if self._query_notion_pages(payload, index) is None:
+                return None
+
+        return index
+
+    def _query_notion_pages(self, payload, index=None):
+        """
+        Run a (paginated) Notion database query and index the returned pages by title.
+
+        Args:
+            payload (dict): The query payload; `start_cursor` is set on it while paginating.
+            index (dict, optional): An index to extend in place. Defaults to a new dictionary.
+
+        Returns:
+            dict or None: The index mapping each title to a list of
+                `(page_id, frozenset(collection_names))` tuples, or None if a request failed.
+        """
+
+        if index is None:
+            index = {}
+
+        while True:
+            response = self.notion_session.post(
+                self._search_url, json=payload, timeout=30
+            )
+
+            try:
+                response_data = response.json()
+            except ValueError:
+                ztn_logger.error("Failed to parse response: %s", response.text)
+                return None
 
-            # Log a warning in case there are more than one result for the same title and collections
-            if len(results) > 1:
+            if response.status_code != 200 or not isinstance(response_data, dict):
                 ztn_logger.warning(
-                    "Multiple entries found for title: '%s' and collections: '%s'. Returning the first match.",
-                    title,
-                    collection_names,
+                    "Failed to query the Notion database. Status code: %s",
+                    response.status_code,
                 )
+                return None
 
-            # If a result is found, return the page ID for updating using the update_reference_in_notion method
-            if results:
-                ztn_logger.debug("Page ID: %s", results[0]["id"])
-                return results[0][
-                    "id"
-                ]  # Generally, there shouldn't be duplicated entries, so there should only be one match (hence choosing the first match)
-        return None
+            for page in response_data.get("results", []):
+                properties = page.get("properties", {})
+                title = "".join(
+                    part.get("plain_text", "")
+                    for part in properties.get("Title", {}).get("title", [])
+                )
+                collection_names = frozenset(
+                    option.get("name")
+                    for option in properties.get("Collections", {}).get(
+                        "multi_select", []
+                    )
+                )
+                index.setdefault(title, []).append((page["id"], collection_names))
+
+            if not response_data.get("has_more"):
+                return index
+            payload["start_cursor"] = response_data.get("next_cursor")
+
+    def _merge_into_notion_index(self, found):
+        """Merge bulk lookup results into the active index, skipping pages already present."""
+        with self._notion_index_lock:
+            if self._notion_index is None:
+                return
+            for title, entries in found.items():
+                known = self._notion_index.setdefault(title, [])
+                known_ids = {page_id for page_id, _ in known}
+                known.extend(entry for entry in entries if entry[0] not in known_ids)
+
+    def _add_to_notion_index(self, title, page_id, collection_names):
+        """Record a page created or updated during the run in the prefetched index, if one is active."""
+        if page_id is None:
+            return
+        with self._notion_index_lock:
+            if self._notion_index is not None:
+                # An updated page now has `collection_names`, so its old entry is replaced
+                entries = [
+                    entry
+                    for entry in self._notion_index.get(title, ())
+                    if entry[0] != page_id
+                ]
+                # The written page is the most recently edited one, so it goes first
+                entries.insert(0, (page_id, frozenset(filter(None, collection_names))))
+                self._notion_index[title] = entries
+
+    def _find_page_id(self, title, collection_names):
+        """
+        Find the page ID of a reference, using the prefetched index when available.
+
+        Matches the semantics of `find_reference_in_notion`: the title must be equal and, if
+        collection names are given, the page must share at least one of them. The index is
+        filled from queries sorted by `last_edited_time` (and pages written during the run are
+        put first), so duplicates resolve to the most recently edited page either way.
+
+        Args:
+            title (str): The title of the reference to search for.
+            collection_names (list): A list of collection names to filter the search by.
+
+        Returns:
+            str or None: The page ID of the found reference if it exists; None otherwise.
+
+        Raises:
+            NotionQueryError: If the index is unavailable and the fallback query fails.
+        """
+        with self._notion_index_lock:
+            index = self._notion_index
+            candidates = list(index.get(title, ())) if index is not None else None
+
+        if candidates is None:
+            return self.find_reference_in_notion(title, collection_names)
+
+        wanted = frozenset(filter(None, collection_names or ()))
+        matches = [
+            page_id
+            for page_id, page_collections in candidates
+            if not wanted or wanted & page_collections
+        ]
+
+        if len(matches) > 1:
+            ztn_logger.warning(
+                "Multiple entries found for title: '%s' and collections: '%s'. Returning the most recently edited match.",
+                title,
+                collection_names,
+            )
+
+        return matches[0] if matches else None
 
     def sync_all_references_to_notion(self):
         """
@@ -720,44 +1223,297 @@ class ZoteroToNotion:
         If a match is found, the method skips adding the reference. If no match is found, it adds the reference to Notion.
 
         Steps:
-        1. Fetch references from Zotero.
-        2. Fetch collections from Zotero.
-        3. Iterate through each reference:
+        1. Fetch collections from Zotero, prefetch the Notion database and request the first
+           page of references, all concurrently.
+        2. Stream references from Zotero page by page.
+        3. Iterate through each reference as it arrives:
         - Format the collection names based on the IDs found in the reference.
         - Check if the reference exists in Notion.
         - If it exists, log that it is skipped.
         - If it does not exist, add it to the Notion database.
 
+        The Notion database is prefetched once into an in-memory index, so existence checks
+        are local lookups instead of one query per reference.
+
+        With a `cache`, references whose Zotero version was already synced are skipped
+        without any Notion request.
+
+        The Notion requests are I/O-bound and independent per reference, so references are
+        processed concurrently by up to `max_workers` threads sharing the pooled session.
+        A failure on one reference is logged and does not stop the others.
+
+        References are streamed: at most a few Zotero pages are fetched ahead, one batch of
+        100 is held at a time, and no more than 2 * `max_workers` upserts are queued. What
+        grows with the library is only the per-title duplicate set and the Notion index.
+
         Returns:
             None: This function does not return any values. It performs operations to sync data between Zotero and Notion.
         """
 
-        references = self.fetch_zotero_reference()
-        ztn_logger.debug("Fetched %d references from Zotero", len(references))
+        # The collections, the Notion index and the first Zotero page are independent requests,
+        # so fetch them concurrently instead of one after another
+        references = self.iter_zotero_references()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            collections_future = executor.submit(self.fetch_collections)
+            index_future = executor.submit(self._build_notion_index)
+            first_future = executor.submit(next, references, None)
+
+            collections = collections_future.result()
+            self._notion_index = index_future.result()
+            first_reference = first_future.result()
 
-        collections = self.fetch_collections()
         ztn_logger.debug("Fetch %d collections from Zotero", len(collections))
+        if first_reference is not None:
+            references = chain((first_reference,), references)
 
-        for reference in references:
+        # If the database cannot be prefetched, look titles up in batches instead
+        bulk_lookup = self._notion_index is None
+        if bulk_lookup:
+            self._notion_index = {}
 
-            if reference is None:
-                continue
+        try:
+            # References are consumed lazily, so Notion writes start while later pages are fetched
+            reference_count = self._sync_references(
+                references, collections, bulk_lookup
+            )
+            ztn_logger.debug("Fetched %d references from Zotero", reference_count)
+        finally:
+            # The index is only valid for this run
+            with self._notion_index_lock:
+                self._notion_index = None
 
-            if (
-                "data" in reference
-                and isinstance(reference["data"], dict)
-                and "title" in reference["data"]
-            ):
-                title = reference["data"]["title"]
-                # Format Collections (list of collections)
-                collection_names = self.format_collection_names(
-                    reference["data"].get("collections", []), collections
+    def _sync_references(self, references, collections, bulk_lookup=False):
+        """
+        Add or update each reference in Notion using the thread pool.
+
+        Duplicate references (same title and collections) are synced only once; the first
+        occurrence wins. With a `cache`, references whose Zotero version and collection names
+        were already written to Notion are skipped as well (see `_pending_reference`).
+
+        Args:
+            references (iterable): The validated references to sync.
+            collections (dict): A dictionary mapping collection IDs to their names.
+            bulk_lookup (bool): Whether to fill the Notion index with `find_references_bulk`
+                for each batch of references before processing it.
+
+        Returns:
+            int: The number of references consumed from `references`.
+        """
+        reference_count = 0
+        skipped_count = 0
+        # (title, frozenset(collection IDs)) of the references already submitted
+        seen = set()
+        references = iter(references)
+        known_page_ids = self._known_page_ids(bulk_lookup)
+        # Futures submitted but not yet completed
+        inflight = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while batch := list(islice(references, ZOTERO_PAGE_SIZE)):
+                reference_count += len(batch)
+
+                pending = []
+                for reference in batch:
+                    # References were validated at ingestion, so only the title needs checking
+                    if "title" not in reference["data"]:
+                        continue
+
+                    # Skip exact duplicates (same title and collections), which only need one write
+                    key = (
+                        reference["data"]["title"],
+                        frozenset(reference["data"].get("collections") or []),
+                    )
+                    if key in seen:
+                        ztn_logger.debug(
+                            "Skipping duplicate reference '%s'",
+                            reference["data"]["title"],
+                        )
+                        continue
+                    seen.add(key)
+
+                    target = self._pending_reference(
+                        reference, collections, known_page_ids
+                    )
+                    if target is None:
+                        skipped_count += 1
+                    else:
+                        pending.append((reference, *target))
+
+                if bulk_lookup and pending:
+                    bulk_lookup = self._lookup_titles(
+                        reference["data"]["title"] for reference, _, _ in pending
+                    )
+
+                self._submit_upserts(executor, pending, inflight)
+
+        if skipped_count:
+            ztn_logger.info("Skipped %d unchanged references.", skipped_count)
+
+        return reference_count
+
+    def _known_page_ids(self, bulk_lookup):
+        """
+        Return the IDs of every page in the prefetched Notion index, or None if they are unknown.
+
+        With the whole database prefetched, a cached page missing from it was deleted in Notion,
+        so its reference must be synced again instead of being skipped. The IDs are only needed
+        (and only complete) when a cache is used and the index was not built by bulk lookups.
+        """
+        if self.cache is None or bulk_lookup or self._notion_index is None:
+            return None
+        return {
+            page_id for entries in self._notion_index.values() for page_id, _ in entries
+        }
+
+    def _pending_reference(self, reference, collections, known_page_ids):
+        """
+        Decide whether a reference needs to be synced, and to which cached page.
+
+        Args:
+            reference (dict): A validated reference with a title.
+            collections (dict): A dictionary mapping collection IDs to their names.
+            known_page_ids (set or None): The page IDs of the prefetched database (see
+                `_known_page_ids`); None if they are unknown.
+
+        Returns:
+            tuple or None: The `(collection_names, cached_page_id)` to sync the reference with
+                (`cached_page_id` is None when the page must be looked up), or None if the cache
+                shows the reference's version and collection names already reached Notion.
+        """
+        # Format Collections (list of collections)
+        collection_names = self.format_collection_names(
+            reference["data"].get("collections") or [], collections
+        )
+
+        if self.cache is None:
+            return collection_names, None
+
+        cached = self.cache.get(reference.get("key"))
+        if cached is None or (
+            known_page_ids is not None and cached[2] not in known_page_ids
+        ):
+            return collection_names, None
+
+        # Items whose Zotero version and collection names were already written to Notion
+        # need no request at all (renaming a collection keeps the version)
+        if cached[:2] == (
+            reference.get("version"),
+            collections_digest(collection_names),
+        ):
+            return None
+
+        # Keep the cached page ID so the Notion lookup can be skipped
+        return collection_names, cached[2]
+
+    def _lookup_titles(self, titles):
+        """
+        Merge the pages matching `titles` into the Notion index with `find_references_bulk`.
+
+        Returns:
+            bool: Whether to keep using bulk lookups; False if the query failed, in which case
+                the index is dropped and the rest of the run falls back to one query per reference.
+        """
+        found = self.find_references_bulk(titles)
+        if found is None:
+            with self._notion_index_lock:
+                self._notion_index = None
+            return False
+
+        self._merge_into_notion_index(found)
+        return True
+
+    def _submit_upserts(self, executor, pending, inflight):
+        """
+        Submit an upsert for each `(reference, collection_names, page_id)` in `pending`.
+
+        Before each submission, wait for a slot so at most 2 * `max_workers` upserts are queued
+        and memory stays bounded by the batch, not by the library size. A failed upsert is
+        logged and does not stop the others.
+
+        Args:
+            executor (ThreadPoolExecutor): The executor running the upserts.
+            pending (list): The references to submit, as built by `_sync_references`.
+            inflight (set): The futures not yet completed; updated in place.
+        """
+        for reference, collection_names, page_id in pending:
+            title = reference["data"]["title"]
+            ztn_logger.debug("Collection names of '%s': %s", title, collection_names)
+
+            if len(inflight) >= 2 * self.max_workers:
+                done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                inflight -= done
+
+            future = executor.submit(
+                self._upsert_reference, reference, collection_names, page_id
+            )
+            future.add_done_callback(partial(_log_upsert_failure, title=title))
+            inflight.add(future)
+
+    def _upsert_reference(self, reference, collection_names, page_id=None):
+        """
+        Update the reference's Notion page, or add a new one.
+
+        A `page_id` remembered by the cache is updated directly. Without one, or if Notion
+        reports that page as gone (404, or 400 for an archived page), the reference is looked
+        up once first. Any other failed update (e.g., 429/5xx after the retries) is logged and
+        nothing else is written, since a title lookup could miss a renamed reference and create
+        a duplicate. If the lookup fails, `NotionQueryError` propagates and nothing is written.
+
+        Workers hold a per-title lock from the lookup to the write, so references sharing a
+        title (e.g., in overlapping collections) see each other's new pages instead of racing
+        to create duplicates, like the serial loop did.
+
+        Returns:
+            str or None: The ID of the written page, or None if the request failed.
+        """
+        title = reference["data"]["title"]
+        with self._title_locks[hash(title) % len(self._title_locks)]:
+            return self._upsert_reference_locked(reference, collection_names, page_id)
+
+    def _upsert_reference_locked(self, reference, collection_names, page_id):
+        """Body of `_upsert_reference`, run while holding the lock of the reference's title."""
+        if page_id:
+            status = self.update_reference_in_notion(
+                page_id, reference, collection_names
+            )
+            if status == 200:
+                self._add_to_notion_index(
+                    reference["data"]["title"], page_id, collection_names
                 )
-                ztn_logger.debug(
-                    "Collection names of '%s': %s", title, collection_names
+                self._record(reference, page_id, collection_names)
+                return page_id
+            if status not in (400, 404):
+                ztn_logger.error(
+                    "Failed to update '%s' in Notion (status %s).",
+                    reference["data"]["title"],
+                    status,
                 )
+                return None
+
+        return self._write_reference(
+            reference,
+            collection_names,
+            self._find_page_id(reference["data"]["title"], collection_names),
+        )
 
-                self.add_reference_to_notion(reference, collection_names)
+    def _write_reference(self, reference, collection_names, page_id):
+        """
+        Update the page `page_id` (or add a new page if it is None) and remember the written version.
+
+        Returns:
+            str or None: The ID of the written page, or None if the request failed.
+        """
+        page_id = self.add_reference_to_notion(reference, collection_names, page_id)
+        if page_id:
+            self._record(reference, page_id, collection_names)
+        return page_id
+
+    def _record(self, reference, page_id, collection_names):
+        """Remember in the cache (if any) that the reference's version and collections reached `page_id`."""
+        if self.cache is not None and "key" in reference:
+            self.cache.record(
+                reference["key"], reference.get("version"), page_id, collection_names
+            )
 
     def sync_reference_to_notion(self):
         """
@@ -771,75 +1527,77 @@ class ZoteroToNotion:
         ztn_logger.info("Starting sync for reference: '%s'", search_title)
 
         try:
-            # Fetch all references and collection names in Zotero
-            references = self.fetch_zotero_reference()
-            collections = self.fetch_collections()
+            # Let Zotero's quick search narrow the items down and stop at the first exact match,
+            # instead of downloading the whole library
+            reference = next(
+                (
+                    reference
+                    for reference in self.iter_zotero_references({"q": search_title})
+                    if reference["data"].get("title") == search_title
+                ),
+                None,
+            )
+            collections = self.fetch_collections() if reference is not None else {}
 
         except requests.exceptions.RequestException as e:
             ztn_logger.error("Failed to fetch data from Zotero: '%s'", str(e))
+            return
+
+        if reference is None:
+            ztn_logger.warning("No matching reference found for '%s'.", search_title)
+            return
+
+        # Get collection names for the reference
+        collection_names = self.format_collection_names(
+            collection_ids=reference["data"].get("collections") or [],
+            collections=collections,
+        )
 
-        # Process references
-        for reference in references:
+        try:
+            # Check if the reference already exists in Notion, then update or add it
+            # through the same path as `sync_all_references_to_notion`
+            notion_page_id = self._find_page_id(search_title, collection_names)
             if (
-                reference
-                and "data" in reference
-                and isinstance(reference["data"], dict)
-                and reference["data"].get("title") == search_title
+                self._write_reference(reference, collection_names, notion_page_id)
+                is None
             ):
-                # Get collection names for the reference
-                collection_names = self.format_collection_names(
-                    collection_ids=reference["data"]["collections"],
-                    collections=collections,
+                ztn_logger.error(
+                    "Failed to sync reference '%s' to Notion.", search_title
                 )
+            elif notion_page_id:
+                ztn_logger.info("Updated reference '%s' in Notion.", search_title)
+            else:
+                ztn_logger.info("Added reference '%s' to Notion.", search_title)
 
-                try:
-                    # Check if the reference already exists in Notion
-                    notion_page_id = self.find_reference_in_notion(
-                        title=search_title, collection_names=collection_names
-                    )
-                    # Update if it exists
-                    if notion_page_id:
-                        self.update_reference_in_notion(
-                            notion_page_id,
-                            reference,
-                            collection_names,
-                        )
-                        ztn_logger.info(
-                            "Updated reference '%s' in Notion.", search_title
-                        )
-                    else:
-                        self.add_reference_to_notion(reference, collection_names)
-                        ztn_logger.info("Added reference '%s' to Notion.", search_title)
-
-                except Exception as e:
-                    ztn_logger.error(
-                        "Failed to process reference '%s': %s", search_title, str(e)
-                    )
-                return  # Exit after processing the matching reference
-
-        ztn_logger.warning("No matching reference found for '%s'.", search_title)
+        except Exception as e:
+            ztn_logger.error(
+                "Failed to process reference '%s': %s", search_title, str(e)
+            )
 
 
 # Temporary main function for testing
 if __name__ == "__main__":
-    from zotero_notion_sync import config
+    from zotero_notion_sync.config import get_settings
+    from zotero_notion_sync.logging_config import configure_logging
+
+    configure_logging()
 
     # Create an instance of the ZoteroToNotion class with dependency injection
-    zotero_to_notion = ZoteroToNotion(config)
+    with ZoteroToNotion(get_settings()) as zotero_to_notion:
 
-    # zotero_to_notion.fetch_zotero_reference()
+        # zotero_to_notion.fetch_zotero_reference()
 
-    # zotero_to_notion.fetch_collections()
+        # zotero_to_notion.fetch_collections()
 
-    # zotero_to_notion.find_reference_in_notion(
-    #     "A Review of the Role of Artificial Intelligence in Healthcare", ["AI"]
-    # )
+        # zotero_to_notion.find_reference_in_notion(
+        #     "A Review of the Role of Artificial Intelligence in Healthcare", ["AI"]
+        # )
 
-    # print(zotero_to_notion.notion_headers)
-    # result = zotero_to_notion.find_reference_in_notion("AI-Driven Privacy in Elderly Care: Developing a Comprehensive Solution for Camera-Based Monitoring of Older Adults")
-    # print(result)
+        # print(zotero_to_notion.notion_headers)
+        # result = zotero_to_notion.find_reference_in_notion("AI-Driven Privacy in Elderly Care: Developing a Comprehensive Solution for Camera-Based Monitoring of Older Adults")
+        # print(result)
 
-    # references = zotero_to_notion.fetch_zotero_reference()
-    # zotero_to_notion.add_reference_to_notion(references[0])
+        # references = zotero_to_notion.fetch_zotero_reference()
+        # zotero_to_notion.add_reference_to_notion(references[0])
 
-    zotero_to_notion.sync_reference_to_notion()
+        zotero_to_notion.sync_reference_to_notion()